@@ -1,24 +1,38 @@
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Iterator
+from importlib import import_module
 from typing import Literal, cast
 
-from .parsers.anthropic_parser import AnthropicPDFParser
-from .parsers.docling_parser import DoclingPDFParser
-from .parsers.llama_parser import LlamaPDFParser
-from .parsers.openai_parser import OpenAIPDFParser
-from .parsers.pymupdf_parser import PyMuPDFParser
 from .parsers.schemas import ParserOutput
 
 
 class PDFParser:
     """
     Parse PDF files using different parsers.
+
+    Parser backends are imported on first use, so only the dependencies of the
+    selected backend are loaded (e.g. choosing "pymupdf" does not import docling).
+
+    Parsed outputs are cached per file, keyed by the parser configuration, the file's
+    path, modification time and size, and the requested modalities. With
+    cache_key="content", files are identified by a SHA-256 hash of their content
+    instead, so copies and re-downloads of a file also hit the cache. The cache is
+    shared between instances and keeps the most recently used entries.
     """
 
-    PARSER_MAP: dict[str, type] = {
-        "docling": DoclingPDFParser,
-        "llama": LlamaPDFParser,
-        "pymupdf": PyMuPDFParser,
-        "anthropic": AnthropicPDFParser,
-        "openai": OpenAIPDFParser,
+    PARSE_CACHE_SIZE = 32
+    _PARSE_CACHE: OrderedDict[tuple, ParserOutput] = OrderedDict()
+    # Content hashes by (path, modification time, size), so unchanged files are read only once
+    _DIGEST_CACHE: OrderedDict[tuple, str] = OrderedDict()
+
+    PARSER_MAP: dict[str, str | type] = {
+        "docling": "parsestudio.parsers.docling_parser:DoclingPDFParser",
+        "llama": "parsestudio.parsers.llama_parser:LlamaPDFParser",
+        "pymupdf": "parsestudio.parsers.pymupdf_parser:PyMuPDFParser",
+        "anthropic": "parsestudio.parsers.anthropic_parser:AnthropicPDFParser",
+        "openai": "parsestudio.parsers.openai_parser:OpenAIPDFParser",
     }
 
     def __init__(
@@ -27,6 +41,7 @@ class PDFParser:
             "docling", "llama", "pymupdf", "anthropic", "openai"
         ] = "docling",
         parser_kwargs: dict | None = None,
+        cache_key: Literal["stat", "content"] = "stat",
     ):
         """
         Initialize the PDF parser with the specified backend.
@@ -34,24 +49,144 @@ class PDFParser:
         Args:
             parser (str): The parser backend to use. Options are 'docling', 'llama', 'pymupdf', 'anthropic', and 'openai'. Defaults to 'docling'.
             parser_kwargs (dict): Additional keyword arguments to pass to the parser. Check the documentation of the parser for more information.
+            cache_key (str): How cached outputs identify a file: "stat" uses its path, modification time and size; "content" uses a hash of its bytes. Defaults to 'stat'.
 
         Raises:
-            ValueError: If an invalid parser is specified.
+            ValueError: If an invalid parser or cache key is specified.
         """
         if parser_kwargs is None:
             parser_kwargs = {}
         parser_name = parser.lower()
-        parser_class = self.PARSER_MAP.get(parser_name)
-        if not parser_class:
+        if parser_name not in self.PARSER_MAP:
             raise ValueError(
                 f"Invalid parser: '{parser}'. Valid options are: {list(self.PARSER_MAP.keys())}"
             )
+        if cache_key not in ("stat", "content"):
+            raise ValueError(
+                f"Invalid cache key: '{cache_key}'. Valid options are: ['stat', 'content']"
+            )
+        parser_class = self._load_parser_class(parser_name)
         self.parser = parser_class(**parser_kwargs)
+        self._parser_key = (parser_name, repr(parser_kwargs))
+        self._cache_by_content = cache_key == "content"
+
+    @classmethod
+    def _load_parser_class(cls, parser_name: str) -> type:
+        """
+        Import the parser class registered under the given name.
+
+        Args:
+            parser_name (str): The name of a registered parser.
+
+        Returns:
+            parser_class (type): The parser class.
+        """
+        parser_class = cls.PARSER_MAP[parser_name]
+        if isinstance(parser_class, str):
+            module_name, class_name = parser_class.split(":")
+            parser_class = getattr(import_module(module_name), class_name)
+            cls.PARSER_MAP[parser_name] = parser_class
+        return parser_class
+
+    @classmethod
+    def register_parser(cls, name: str, parser_class: type | str) -> None:
+        """
+        Register an additional parser backend.
+
+        Args:
+            name (str): The name used to select the parser, e.g. PDFParser(parser=name).
+            parser_class (Union[type, str]): The parser class, or its import path as "module:ClassName" to import it lazily. It must accept the parser_kwargs as keyword arguments and implement a parse(paths, modalities, **kwargs) method.
+
+        Examples:
+
+        !!! example
+            ```python
+            PDFParser.register_parser("custom", CustomPDFParser)
+            parser = PDFParser(parser="custom")
+            ```
+        """
+        cls.PARSER_MAP[name.lower()] = parser_class
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Drop all cached parser outputs.
+        """
+        cls._PARSE_CACHE.clear()
+        cls._DIGEST_CACHE.clear()
+
+    def _cache_key(self, path: str, modalities: list[str], kwargs: dict) -> tuple:
+        """
+        Build the cache key of a parsed file.
+
+        Args:
+            path (str): The path to the PDF file.
+            modalities (List[str]): The modalities to extract.
+            kwargs (dict): The keyword arguments passed to the parser.
+
+        Returns:
+            key (tuple): A hashable key identifying the parser output.
+
+        Raises:
+            OSError: If the file cannot be accessed.
+        """
+        stat = os.stat(path)
+        file_key: tuple = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+        if self._cache_by_content:
+            file_key = (self._file_digest(path, file_key),)
+        return (
+            self._parser_key,
+            *file_key,
+            tuple(sorted(modalities)),
+            repr(sorted(kwargs.items())),
+        )
+
+    @classmethod
+    def _file_digest(cls, path: str, stat_key: tuple) -> str:
+        """
+        Hash the content of a file, reusing the hash while the file is unchanged.
+
+        Args:
+            path (str): The path to the file.
+            stat_key (tuple): The real path, modification time and size of the file.
+
+        Returns:
+            digest (str): The SHA-256 hex digest of the file.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        digest = cls._DIGEST_CACHE.get(stat_key)
+        if digest is None:
+            with open(path, "rb") as file:
+                digest = hashlib.file_digest(file, "sha256").hexdigest()
+            cls._DIGEST_CACHE[stat_key] = digest
+            # The parse cache never holds more files than this
+            if len(cls._DIGEST_CACHE) > cls.PARSE_CACHE_SIZE:
+                cls._DIGEST_CACHE.popitem(last=False)
+        else:
+            cls._DIGEST_CACHE.move_to_end(stat_key)
+        return digest
+
+    @staticmethod
+    def _has_content(output: ParserOutput) -> bool:
+        """
+        Check whether a parser output holds any text, tables or images.
+
+        Args:
+            output (ParserOutput): The parser output.
+
+        Returns:
+            True if the output is not empty.
+        """
+        text = output.text.text if output.text is not None else ""
+        return bool(text or output.tables or output.images)
 
     def run(
         self,
         pdf_path: str | list[str],
         modalities: list[str] | None = None,
+        cache: bool = False,
         **kwargs,
     ) -> list[ParserOutput]:
         """
@@ -60,6 +195,7 @@ class PDFParser:
         Args:
             pdf_path (str or List[str]): The path to the PDF file(s) to parse.
             modalities (List[str]): The modalities to extract from the PDF file(s). Defaults to ["text", "tables", "images"].
+            cache (bool): Whether to reuse the outputs of files parsed before with the same parser configuration and modalities. Cached outputs are shared between calls, so copy them before modifying. Outputs without any text, tables or images are never cached. Defaults to False.
             **kwargs: Additional keyword arguments to pass to parser. Check the documentation of the parser for more information.
 
         Returns:
@@ -133,6 +269,100 @@ class PDFParser:
         """
         if modalities is None:
             modalities = ["text", "tables", "images"]
+        if not cache:
+            return self._parse(pdf_path, modalities, **kwargs)
+
+        paths = [pdf_path] if isinstance(pdf_path, str) else list(pdf_path)
+        try:
+            keys = [self._cache_key(path, modalities, kwargs) for path in paths]
+        except OSError:
+            # Let the parser report missing or unreadable files
+            return self._parse(paths, modalities, **kwargs)
+
+        results: dict[tuple, ParserOutput] = {}
+        missing_paths: list[str] = []
+        missing_keys: list[tuple] = []
+        for path, key in zip(paths, keys, strict=True):
+            if key in self._PARSE_CACHE:
+                self._PARSE_CACHE.move_to_end(key)
+                results[key] = self._PARSE_CACHE[key]
+            elif key not in missing_keys:
+                missing_paths.append(path)
+                missing_keys.append(key)
+
+        if missing_paths:
+            outputs = self._parse(missing_paths, modalities, **kwargs)
+            if len(outputs) != len(missing_paths):
+                raise ValueError(
+                    f"Parser returned {len(outputs)} outputs for {len(missing_paths)} files"
+                )
+            for key, output in zip(missing_keys, outputs, strict=True):
+                results[key] = output
+                if not self._has_content(output):
+                    # Do not keep the result of a failed or empty parse
+                    continue
+                self._PARSE_CACHE[key] = output
+                if len(self._PARSE_CACHE) > self.PARSE_CACHE_SIZE:
+                    self._PARSE_CACHE.popitem(last=False)
+
+        return [results[key] for key in keys]
+
+    def iter_run(
+        self,
+        pdf_path: str | list[str],
+        modalities: list[str] | None = None,
+        **kwargs,
+    ) -> Iterator[ParserOutput]:
+        """
+        Run the PDF parser and yield the output of each PDF file as soon as it is parsed.
+
+        Unlike run, the outputs are not collected in a list nor cached, so only the
+        documents being parsed are kept in memory. Parsers that provide an iter_parse
+        method stream their results directly; the others are run one file at a time.
+
+        Args:
+            pdf_path (str or List[str]): The path to the PDF file(s) to parse.
+            modalities (List[str]): The modalities to extract from the PDF file(s). Defaults to ["text", "tables", "images"].
+            **kwargs: Additional keyword arguments to pass to parser. Check the documentation of the parser for more information.
+
+        Returns:
+            The parsed outputs, in the order of the given PDF file(s).
+
+        Examples:
+
+        !!! example
+            ```python
+            parser = PDFParser(parser="pymupdf")
+            for output in parser.iter_run(["a.pdf", "b.pdf"], modalities=["text"]):
+                save(output.text.text)
+            ```
+        """
+        if modalities is None:
+            modalities = ["text", "tables", "images"]
+        paths = [pdf_path] if isinstance(pdf_path, str) else pdf_path
+
+        iter_parse = getattr(self.parser, "iter_parse", None)
+        if iter_parse is not None:
+            yield from iter_parse(paths, modalities=modalities, **kwargs)
+            return
+
+        for path in paths:
+            yield from self._parse([path], modalities, **kwargs)
+
+    def _parse(
+        self, pdf_path: str | list[str], modalities: list[str], **kwargs
+    ) -> list[ParserOutput]:
+        """
+        Run the parser backend without the cache.
+
+        Args:
+            pdf_path (str or List[str]): The path to the PDF file(s) to parse.
+            modalities (List[str]): The modalities to extract from the PDF file(s).
+            **kwargs: Additional keyword arguments to pass to parser.
+
+        Returns:
+            The parsed output(s) from the PDF file(s).
+        """
         return cast(
             "list[ParserOutput]",
             self.parser.parse(pdf_path, modalities=modalities, **kwargs),
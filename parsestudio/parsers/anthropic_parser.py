@@ -1,12 +1,19 @@
-import base64
 import os
 from collections.abc import Generator
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from base64 import b64encode
+else:
+    try:
+        from pybase64 import b64encode
+    except ImportError:
+        from base64 import b64encode
+
 from parsestudio.logging_config import get_logger
 
 from .schemas import ImageElement, Metadata, ParserOutput, TableElement, TextElement
@@ -14,6 +21,9 @@ from .schemas import ImageElement, Metadata, ParserOutput, TableElement, TextEle
 load_dotenv()
 logger = get_logger("parsers.anthropic")
 
+# Representations built for each extracted table
+TABLE_FORMATS = ["markdown", "dataframe"]
+
 
 class AnthropicPDFParser:
     """
@@ -59,9 +69,7 @@ class AnthropicPDFParser:
         for path in paths:
             try:
                 with open(path, "rb") as pdf_file:
-                    pdf_data = base64.standard_b64encode(pdf_file.read()).decode(
-                        "utf-8"
-                    )
+                    pdf_data = b64encode(pdf_file.read()).decode("ascii")
 
                 response = self.client.beta.messages.create(
                     model=self.options.get("model", "claude-3-5-sonnet-20241022"),
@@ -122,6 +130,23 @@ class AnthropicPDFParser:
                     f"Invalid modality: {modality}. Valid options: {valid_modalities}"
                 )
 
+    @staticmethod
+    def _validate_table_formats(table_formats: list[str]) -> None:
+        """
+        Validate the table formats provided by the user.
+
+        Args:
+            table_formats (List[str]): List of table formats to validate
+
+        Raises:
+            ValueError: If the table format is not valid
+        """
+        for table_format in table_formats:
+            if table_format not in TABLE_FORMATS:
+                raise ValueError(
+                    f"Invalid table format: {table_format}. Valid options: {TABLE_FORMATS}"
+                )
+
     def parse(
         self,
         paths: str | list[str],
@@ -134,7 +159,7 @@ class AnthropicPDFParser:
         Args:
             paths: Path or list of paths to PDF files
             modalities: List of modalities to extract. Default: ["text", "tables", "images"]
-            **kwargs: Additional keyword arguments for parsing
+            **kwargs: Additional keyword arguments for parsing. table_formats selects the table representations to build, among "markdown" and "dataframe" (default both); pass ["markdown"] to skip building DataFrames.
 
         Returns:
             List[ParserOutput]: Parsed outputs
@@ -153,22 +178,29 @@ class AnthropicPDFParser:
         if modalities is None:
             modalities = ["text", "tables", "images"]
         self._validate_modalities(modalities)
-        # kwargs reserved for future use
+        table_formats: list[str] = kwargs.get("table_formats", TABLE_FORMATS)
+        self._validate_table_formats(table_formats)
         if isinstance(paths, str):
             paths = [paths]
         data = []
         for result in self.load_documents(paths):
-            output = self.__export_result(result, modalities)
+            output = self.__export_result(result, modalities, table_formats)
             data.append(output)
         return data
 
-    def __export_result(self, parsed_data: dict, modalities: list[str]) -> ParserOutput:
+    def __export_result(
+        self,
+        parsed_data: dict,
+        modalities: list[str],
+        table_formats: list[str] | None = None,
+    ) -> ParserOutput:
         """
         Export parsed data to ParserOutput format.
 
         Args:
             parsed_data: Dictionary containing parsed content
             modalities: List of modalities to extract
+            table_formats: Table representations to build. Defaults to ["markdown", "dataframe"]
 
         Returns:
             ParserOutput: Structured output with requested modalities
@@ -178,21 +210,32 @@ class AnthropicPDFParser:
             if "text" in modalities
             else TextElement(text="")
         )
-        tables = self._extract_tables(parsed_data) if "tables" in modalities else []
+        tables = (
+            self._extract_tables(parsed_data, table_formats)
+            if "tables" in modalities
+            else []
+        )
         images: list[ImageElement] = []  # Images not supported in current API version
         return ParserOutput(text=text, tables=tables, images=images)
 
     @staticmethod
-    def _extract_tables(parsed_data: dict) -> list[TableElement]:
+    def _extract_tables(
+        parsed_data: dict, table_formats: list[str] | None = None
+    ) -> list[TableElement]:
         """
         Extract tables from parsed data.
 
         Args:
             parsed_data: Dictionary containing parsed content
+            table_formats: Table representations to build, among "markdown" and "dataframe". Defaults to both
 
         Returns:
             List[TableElement]: List of extracted tables with metadata
         """
+        if table_formats is None:
+            table_formats = TABLE_FORMATS
+        want_markdown = "markdown" in table_formats
+        want_dataframe = "dataframe" in table_formats
         tables = []
         for table in parsed_data.get("tables", []):
             try:
@@ -206,10 +249,18 @@ class AnthropicPDFParser:
                     ]  # Skip first and last empty cells
                     if row:
                         rows.append(row)
-                table_df = pd.DataFrame(rows, columns=headers)
+                if not rows and not any(headers):
+                    continue
+                table_df = None
+                if want_dataframe:
+                    table_df = (
+                        pd.DataFrame.from_records(rows, columns=headers)
+                        if rows
+                        else pd.DataFrame(columns=headers)
+                    )
                 tables.append(
                     TableElement(
-                        markdown=markdown,
+                        markdown=markdown if want_markdown else None,
                         dataframe=table_df,
                         metadata=Metadata(
                             page_number=table.get("page_number", 1),
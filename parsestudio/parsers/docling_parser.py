@@ -1,6 +1,12 @@
+import multiprocessing
 import sys
-from collections.abc import Generator
-from typing import TYPE_CHECKING
+import weakref
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from io import BytesIO
+from itertools import repeat
+from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -9,18 +15,26 @@ else:
         import pandas as pd
     except ImportError:
         pd = None
+import fitz  # PyMuPDF
 from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
 from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
-from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.base_models import ConversionStatus, DocumentStream, InputFormat
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import (
     EasyOcrOptions,
     PdfPipelineOptions,
+    RapidOcrOptions,
     TableFormerMode,
     TableStructureOptions,
 )
+from docling.datamodel.settings import settings
 from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling_core.types.doc import DoclingDocument, PictureItem, TableItem
+from docling_core.transforms.serializer.base import SerializationResult
+from docling_core.transforms.serializer.markdown import (
+    MarkdownDocSerializer,
+    MarkdownParams,
+)
+from docling_core.types.doc import DoclingDocument, NodeItem, PictureItem, TableItem
 
 if TYPE_CHECKING:
     from PIL import Image
@@ -36,17 +50,92 @@ from .schemas import ImageElement, Metadata, ParserOutput, TableElement, TextEle
 
 logger = get_logger("parsers.docling")
 
+# Start method of the worker processes; spawn behaves the same on every platform and
+# never forks a process that already holds the loaded models
+MP_START_METHOD = "spawn"
+
+# Representations built for each extracted table
+TABLE_FORMATS = ["markdown", "dataframe"]
+
+
+# Parser of the current worker process, built once by _init_worker
+_worker_parser: "DoclingPDFParser | None" = None
+
+
+class _ItemCollectingSerializer(MarkdownDocSerializer):
+    """
+    Markdown serializer that also collects the tables and pictures it walks over, in reading order.
+    """
+
+    table_items: list[TableItem] = []
+    picture_items: list[PictureItem] = []
+
+    def serialize(
+        self, *, item: NodeItem | None = None, **kwargs
+    ) -> SerializationResult:
+        if isinstance(item, TableItem):
+            self.table_items.append(item)
+        elif isinstance(item, PictureItem):
+            self.picture_items.append(item)
+        return super().serialize(item=item, **kwargs)
+
+
+def _init_worker(parser_options: dict) -> None:
+    """
+    Build the parser of a worker process, so its models are loaded only once.
+
+    Args:
+        parser_options (dict): Keyword arguments used to build the DoclingPDFParser
+    """
+    global _worker_parser
+    _worker_parser = DoclingPDFParser(**parser_options)
+
+
+def _parse_path(path: str, modalities: list[str], parse_options: dict) -> ParserOutput:
+    """
+    Parse a single document with the parser of the worker process.
+
+    Args:
+        path (str): Path to the document
+        modalities (List[str]): List of modalities to extract
+        parse_options (dict): Keyword arguments to pass to the parse method
+
+    Returns:
+        output (ParserOutput): ParserOutput object
+    """
+    if _worker_parser is None:
+        raise RuntimeError("The worker parser is not initialized")
+    return _worker_parser.parse([path], modalities, **parse_options)[0]
+
 
 class DoclingPDFParser:
     """
     Parse a PDF file using the Docling Parser
 
+    Converters are cached per (pipeline options, backend) and shared between
+    parser instances, so the OCR and table structure models are only loaded once
+    per configuration.
+
+    Documents are exported on a thread pool created on first use and reused by
+    later calls. Likewise, the worker processes used when num_workers > 1 are kept
+    alive with their models loaded between calls (see from_pool). Call close(), or
+    use the parser as a context manager, to shut both down when the parser is no
+    longer needed; otherwise they are shut down when the parser is garbage collected
+    or at interpreter exit.
+
     Args:
         pipeline_options (PdfPipelineOptions): Options for the PDF pipeline.
         backend (Union[DoclingParseDocumentBackend, PyPdfiumDocumentBackend]): Backend to use for parsing the PDF.
+        batch_size (Optional[int]): Number of pages sent together through the layout, table structure and OCR models. Larger batches keep a GPU busy; Docling's default is used when None. The page batch size is a global Docling setting, so it is only set while this parser converts documents and restored afterwards; parsers with different batch sizes should not convert at the same time in one process.
+        ocr_quality (Optional[str]): "fast" trades some accuracy for speed: tables use TableFormerMode.FAST and pages are rendered at images_scale=0.75, which also lowers the resolution of the extracted images. "accurate" uses TableFormerMode.ACCURATE. When None, the pipeline options are used as given.
+        ocr_engine (Optional[str]): "rapidocr" runs OCR with RapidOCR on ONNX Runtime, which uses CUDA when Docling's accelerator selects a GPU; "openvino" runs RapidOCR on OpenVINO, which is fastest on Intel CPUs. Both are usually much faster than EasyOCR; install the onnx-ocr or openvino-ocr extra respectively. The OCR mode (e.g. full page) of the given options is kept. When None, the OCR options are used as given.
+        warmup (bool): Whether to run a blank page through the models when the parser is created (see warmup). Default is False
 
     """
 
+    _CONVERTER_CACHE: dict[tuple, DocumentConverter] = {}
+    _WARM_CONVERTERS: set[tuple] = set()
+
     def __init__(
         self,
         pipeline_options: PdfPipelineOptions | None = PdfPipelineOptions(
@@ -56,8 +145,9 @@ class DoclingPDFParser:
                 do_cell_matching=False,
                 mode=TableFormerMode.ACCURATE,  # Or TableFormerMode.FAST
             ),
+            # use_gpu is left unset so EasyOCR runs on a GPU when one is available
             ocr_options=EasyOcrOptions(  # Or TesseractCliOcrOptions or TesseractOcrOptions
-                force_full_page_ocr=True, use_gpu=False
+                force_full_page_ocr=True
             ),  # Other options: lang, ...
             images_scale=1.0,  # Needed to extract images
             generate_picture_images=True,  # Needed to extract images
@@ -65,15 +155,322 @@ class DoclingPDFParser:
         backend: (
             DoclingParseDocumentBackend | PyPdfiumDocumentBackend | None
         ) = DoclingParseDocumentBackend,
+        batch_size: int | None = None,
+        ocr_quality: Literal["fast", "accurate"] | None = None,
+        ocr_engine: Literal["rapidocr", "openvino"] | None = None,
+        warmup: bool = False,
     ):
-        self.converter = DocumentConverter(
-            allowed_formats=[InputFormat.PDF],
-            format_options={
-                InputFormat.PDF: PdfFormatOption(
-                    pipeline_options=pipeline_options, backend=backend
+        if batch_size is not None:
+            pipeline_options = self._with_batch_size(pipeline_options, batch_size)
+        if ocr_quality is not None:
+            pipeline_options = self._with_ocr_quality(pipeline_options, ocr_quality)
+        if ocr_engine is not None:
+            pipeline_options = self._with_ocr_engine(pipeline_options, ocr_engine)
+
+        key = self._converter_key(pipeline_options, backend)
+        converter = self._CONVERTER_CACHE.get(key)
+        if converter is None:
+            converter = DocumentConverter(
+                allowed_formats=[InputFormat.PDF],
+                format_options={
+                    InputFormat.PDF: PdfFormatOption(
+                        pipeline_options=pipeline_options, backend=backend
+                    )
+                },
+            )
+            self._CONVERTER_CACHE[key] = converter
+        self.converter = converter
+        self._converter_cache_key = key
+        self._batch_size = batch_size
+        self._parser_options = {
+            "pipeline_options": pipeline_options,
+            "backend": backend,
+            "batch_size": batch_size,
+            "ocr_quality": ocr_quality,
+            "ocr_engine": ocr_engine,
+            "warmup": warmup,
+        }
+        self._pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        # Shut the pools down if the parser is dropped without being closed
+        self._pool_finalizer: weakref.finalize | None = None
+        self._process_pool_finalizer: weakref.finalize | None = None
+        self._process_pool_size = 0
+        self._num_workers = 1
+        if warmup:
+            self.warmup()
+
+    def warmup(self) -> None:
+        """
+        Run a blank page through the converter once.
+
+        This loads the models and lets the GPU libraries select and compile their
+        kernels up front, so the first document parsed does not pay for it. It is
+        done once per shared converter and is best effort: failures are logged and
+        ignored.
+        """
+        if self._converter_cache_key in self._WARM_CONVERTERS:
+            return
+        try:
+            with fitz.open() as doc:
+                doc.new_page()
+                stream = BytesIO(doc.tobytes())
+            with self._page_batch_size():
+                self.converter.convert(
+                    DocumentStream(name="warmup.pdf", stream=stream),
+                    raises_on_error=False,
                 )
-            },
+        except Exception as e:
+            logger.warning(
+                "Warmup of the Docling models failed",
+                extra={"error": str(e), "parser": "docling"},
+            )
+            return
+        self._WARM_CONVERTERS.add(self._converter_cache_key)
+
+    @classmethod
+    def from_pool(cls, num_workers: int, **kwargs) -> "DoclingPDFParser":
+        """
+        Create a parser that spreads documents over a pool of worker processes.
+
+        The workers are started with the parser and load their models once; they are
+        then reused by every parse call that does not set num_workers.
+
+        Args:
+            num_workers (int): Number of worker processes
+            **kwargs: Keyword arguments to create the parser with, e.g. pipeline_options
+
+        Returns:
+            parser (DoclingPDFParser): The parser
+
+        Raises:
+            ValueError: If the number of workers is not positive
+
+        Examples:
+        !!! example
+            ```python
+            with DoclingPDFParser.from_pool(4) as parser:
+                data = parser.parse(["a.pdf", "b.pdf", "c.pdf", "d.pdf"])
+            ```
+        """
+        if num_workers < 1:
+            raise ValueError(
+                f"Invalid number of workers: {num_workers}. It must be positive"
+            )
+        parser = cls(**kwargs)
+        parser._num_workers = num_workers
+        if num_workers > 1:
+            parser._get_process_pool(num_workers)
+        return parser
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool used to export documents, creating it on first use.
+
+        Returns:
+            pool (ThreadPoolExecutor): The thread pool of the parser
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="parsestudio-docling"
+            )
+            self._pool_finalizer = weakref.finalize(self, self._pool.shutdown)
+        return self._pool
+
+    def _get_process_pool(self, num_workers: int) -> ProcessPoolExecutor:
+        """
+        Get the pool of worker processes, creating it on first use or when its size changes.
+
+        Args:
+            num_workers (int): Number of worker processes
+
+        Returns:
+            pool (ProcessPoolExecutor): The pool of worker processes
+        """
+        if self._process_pool is not None and self._process_pool_size != num_workers:
+            self._shutdown_process_pool()
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context(MP_START_METHOD),
+                initializer=_init_worker,
+                initargs=(self._parser_options,),
+            )
+            self._process_pool_size = num_workers
+            self._process_pool_finalizer = weakref.finalize(
+                self, self._process_pool.shutdown
+            )
+        return self._process_pool
+
+    def close(self) -> None:
+        """
+        Shut down the thread pool and the worker processes of the parser. They are recreated if the parser is used again.
+        """
+        if self._pool_finalizer is not None:
+            self._pool_finalizer()
+            self._pool_finalizer = None
+        self._pool = None
+        self._shutdown_process_pool()
+
+    def _shutdown_process_pool(self) -> None:
+        """
+        Shut down the worker processes of the parser, if any.
+        """
+        if self._process_pool_finalizer is not None:
+            self._process_pool_finalizer()
+            self._process_pool_finalizer = None
+        self._process_pool = None
+
+    def __enter__(self) -> "DoclingPDFParser":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _with_batch_size(
+        pipeline_options: PdfPipelineOptions | None, batch_size: int
+    ) -> PdfPipelineOptions | None:
+        """
+        Apply the batch size to the model batch options.
+
+        The page batch size is set around each conversion instead (see _page_batch_size).
+
+        Args:
+            pipeline_options (PdfPipelineOptions): Options for the PDF pipeline.
+            batch_size (int): Number of pages per batch.
+
+        Returns:
+            pipeline_options (PdfPipelineOptions): A copy of the options with the batch sizes set.
+
+        Raises:
+            ValueError: If the batch size is not positive
+        """
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch size: {batch_size}. It must be positive")
+        if pipeline_options is None:
+            return None
+        # The per-model batch sizes are only available in recent Docling versions
+        fields = type(pipeline_options).model_fields
+        update = {
+            name: batch_size
+            for name in ("layout_batch_size", "table_batch_size", "ocr_batch_size")
+            if name in fields
+        }
+        return pipeline_options.model_copy(update=update)
+
+    @contextmanager
+    def _page_batch_size(self) -> Iterator[None]:
+        """
+        Set Docling's global page batch size to the batch size of the parser, restoring the previous value on exit.
+
+        Returns:
+            context (Iterator[None]): Context in which the batch size is applied
+        """
+        if self._batch_size is None:
+            yield
+            return
+        previous = settings.perf.page_batch_size
+        settings.perf.page_batch_size = self._batch_size
+        try:
+            yield
+        finally:
+            settings.perf.page_batch_size = previous
+
+    @staticmethod
+    def _with_ocr_quality(
+        pipeline_options: PdfPipelineOptions | None, ocr_quality: str
+    ) -> PdfPipelineOptions | None:
+        """
+        Apply the speed/accuracy preset to the pipeline options.
+
+        Args:
+            pipeline_options (PdfPipelineOptions): Options for the PDF pipeline.
+            ocr_quality (str): Either "fast" or "accurate".
+
+        Returns:
+            pipeline_options (PdfPipelineOptions): A copy of the options with the preset applied.
+
+        Raises:
+            ValueError: If the quality is not valid
+        """
+        if ocr_quality not in ("fast", "accurate"):
+            raise ValueError(
+                f"Invalid OCR quality: {ocr_quality}. The valid options are: ['fast', 'accurate']"
+            )
+        if pipeline_options is None:
+            return None
+        fast = ocr_quality == "fast"
+        table_structure_options = pipeline_options.table_structure_options.model_copy(
+            update={"mode": TableFormerMode.FAST if fast else TableFormerMode.ACCURATE}
+        )
+        update: dict = {"table_structure_options": table_structure_options}
+        if fast:
+            update["images_scale"] = 0.75
+        return pipeline_options.model_copy(update=update)
+
+    @staticmethod
+    def _with_ocr_engine(
+        pipeline_options: PdfPipelineOptions | None, ocr_engine: str
+    ) -> PdfPipelineOptions | None:
+        """
+        Switch the pipeline options to an ONNX Runtime or OpenVINO OCR engine.
+
+        Args:
+            pipeline_options (PdfPipelineOptions): Options for the PDF pipeline.
+            ocr_engine (str): Either "rapidocr" or "openvino".
+
+        Returns:
+            pipeline_options (PdfPipelineOptions): A copy of the options using the OCR engine.
+
+        Raises:
+            ValueError: If the OCR engine is not valid
+        """
+        backends = {"rapidocr": "onnxruntime", "openvino": "openvino"}
+        if ocr_engine not in backends:
+            raise ValueError(
+                f"Invalid OCR engine: {ocr_engine}. The valid options are: {list(backends)}"
+            )
+        if pipeline_options is None:
+            return None
+        current = pipeline_options.ocr_options
+        # Older Docling versions only have the force_full_page_ocr flag; newer ones
+        # replace it with a mode, which can also select other regions
+        if "mode" in type(current).model_fields:
+            region = {"mode": current.mode}
+        else:
+            region = {"force_full_page_ocr": current.force_full_page_ocr}
+        # The languages of the other engines use different codes, so RapidOCR's default is kept
+        ocr_options = RapidOcrOptions(backend=backends[ocr_engine], **region)
+        return pipeline_options.model_copy(update={"ocr_options": ocr_options})
+
+    @staticmethod
+    def _converter_key(
+        pipeline_options: PdfPipelineOptions | None,
+        backend: DoclingParseDocumentBackend | PyPdfiumDocumentBackend | None,
+    ) -> tuple:
+        """
+        Build the cache key of a converter from its configuration.
+
+        Args:
+            pipeline_options (PdfPipelineOptions): Options for the PDF pipeline.
+            backend (Union[DoclingParseDocumentBackend, PyPdfiumDocumentBackend]): Backend to use for parsing the PDF.
+
+        Returns:
+            key (tuple): A hashable key identifying the configuration
+        """
+        options_key = (
+            pipeline_options.model_dump_json() if pipeline_options is not None else None
         )
+        return (options_key, backend)
+
+    @classmethod
+    def clear_converter_cache(cls) -> None:
+        """
+        Drop all cached converters and the models they hold.
+        """
+        cls._CONVERTER_CACHE.clear()
+        cls._WARM_CONVERTERS.clear()
 
     def load_documents(
         self,
@@ -94,13 +491,39 @@ class DoclingPDFParser:
         Returns:
             result (Generator[ConversionResult, None, None]): Generator of ConversionResult objects
         """
-
-        yield from self.converter.convert_all(
-            paths,
-            raises_on_error=raises_on_error,
-            max_num_pages=max_num_pages,
-            max_file_size=max_file_size,
+        results = iter(
+            self.converter.convert_all(
+                paths,
+                raises_on_error=raises_on_error,
+                max_num_pages=max_num_pages,
+                max_file_size=max_file_size,
+            )
         )
+        # Documents are converted as the results are consumed, so the batch size is
+        # only applied while the next one is converted, not while the caller holds it
+        while True:
+            with self._page_batch_size():
+                result = next(results, None)
+            if result is None:
+                return
+            yield result
+
+    @staticmethod
+    def _validate_table_formats(table_formats: list[str]) -> None:
+        """
+        Validate the table formats provided by the user. The valid formats are: ["markdown", "dataframe"]
+
+        Args:
+            table_formats (List[str]): List of table formats to validate
+
+        Raises:
+            ValueError: If the table format is not valid
+        """
+        for table_format in table_formats:
+            if table_format not in TABLE_FORMATS:
+                raise ValueError(
+                    f"Invalid table format: {table_format}. The valid table formats are: {TABLE_FORMATS}"
+                )
 
     def _validate_modalities(self, modalities: list[str]) -> None:
         """
@@ -123,6 +546,7 @@ class DoclingPDFParser:
         self,
         paths: str | list[str],
         modalities: list[str] | None = None,
+        num_workers: int | None = None,
         **kwargs,
     ) -> list[ParserOutput]:
         """
@@ -131,13 +555,14 @@ class DoclingPDFParser:
         Args:
             paths (Union[str, List[str]]): Path or list of paths to the documents
             modalities (List[str]): List of modalities to extract. Default is ["text", "tables", "images"]
-            **kwargs: Keyword arguments to pass to the export_to_markdown method. For example, markdown_options={"image_placeholder": "<image>"}
+            num_workers (int): Number of processes to spread the documents over. Each process loads its own models, so this pays off for large batches or for worker pools reused across calls. Workers are spawned, so scripts using more than one must guard their entry point with `if __name__ == "__main__":`. Default is 1, or the size given to from_pool
+            **kwargs: Keyword arguments to pass to the export_to_markdown method. For example, markdown_options={"image_placeholder": "<image>"}. table_formats selects the table representations to build, among "markdown" and "dataframe" (default both); pass ["markdown"] to skip building DataFrames.
 
         Returns:
             data (List[ParserOutput]): List of ParserOutput objects
 
         Raises:
-            ValueError: If the modality is not valid
+            ValueError: If the modality or the table format is not valid
 
         Examples:
         !!! example
@@ -176,36 +601,157 @@ class DoclingPDFParser:
         if modalities is None:
             modalities = ["text", "tables", "images"]
         self._validate_modalities(modalities)
+        self._validate_table_formats(kwargs.get("table_formats", TABLE_FORMATS))
 
         if isinstance(paths, str):
             paths = [paths]
 
-        markdown_options = kwargs.get("markdown_options", {})
+        if num_workers is None:
+            num_workers = self._num_workers
+
+        return list(self._iter_parse(paths, modalities, kwargs, num_workers))
+
+    def iter_parse(
+        self,
+        paths: str | list[str],
+        modalities: list[str] | None = None,
+        num_workers: int | None = None,
+        **kwargs,
+    ) -> Iterator[ParserOutput]:
+        """
+        Parse the documents and yield each output as soon as it is exported.
 
-        raises_on_error = kwargs.get("raises_on_error", True)
-        max_num_pages = kwargs.get("max_num_pages", sys.maxsize)
-        max_file_size = kwargs.get("max_file_size", sys.maxsize)
+        At most two documents are held at a time (the one being yielded and the one
+        being exported), so this suits large batches whose outputs are written out
+        and discarded as they come.
 
-        data = []
+        Args:
+            paths (Union[str, List[str]]): Path or list of paths to the documents
+            modalities (List[str]): List of modalities to extract. Default is ["text", "tables", "images"]
+            num_workers (int): Number of processes to spread the documents over. Default is 1, or the size given to from_pool
+            **kwargs: Keyword arguments, as for the parse method
+
+        Returns:
+            data (Iterator[ParserOutput]): Iterator of ParserOutput objects, in the order of paths
+
+        Raises:
+            ValueError: If the modality or the table format is not valid
+
+        Examples:
+        !!! example
+            ```python
+            parser = DoclingPDFParser()
+            for output in parser.iter_parse(["a.pdf", "b.pdf"], modalities=["text"]):
+                save(output.text.text)
+            ```
+        """
+        if modalities is None:
+            modalities = ["text", "tables", "images"]
+        self._validate_modalities(modalities)
+        self._validate_table_formats(kwargs.get("table_formats", TABLE_FORMATS))
+
+        if isinstance(paths, str):
+            paths = [paths]
+
+        if num_workers is None:
+            num_workers = self._num_workers
+
+        return self._iter_parse(paths, modalities, kwargs, num_workers)
+
+    def _iter_parse(
+        self,
+        paths: list[str],
+        modalities: list[str],
+        parse_options: dict,
+        num_workers: int = 1,
+    ) -> Generator[ParserOutput, None, None]:
+        """
+        Convert the documents and yield their exported outputs in order.
+
+        Args:
+            paths (List[str]): List of paths to the documents
+            modalities (List[str]): List of modalities to extract
+            parse_options (dict): Keyword arguments passed to the parse method
+            num_workers (int): Number of worker processes. Default is 1
+
+        Returns:
+            data (Generator[ParserOutput, None, None]): Generator of ParserOutput objects
+
+        Raises:
+            ValueError: If the conversion of a document fails
+        """
+        if num_workers > 1 and len(paths) > 1:
+            yield from self._iter_parse_parallel(
+                paths, modalities, parse_options, num_workers
+            )
+            return
+
+        markdown_options = parse_options.get("markdown_options", {})
+        table_formats = parse_options.get("table_formats", TABLE_FORMATS)
+
+        raises_on_error = parse_options.get("raises_on_error", True)
+        max_num_pages = parse_options.get("max_num_pages", sys.maxsize)
+        max_file_size = parse_options.get("max_file_size", sys.maxsize)
+
+        # Export finished documents in the background while Docling converts the next one
+        executor = self._get_pool()
+        pending: Future[ParserOutput] | None = None
         for result in self.load_documents(
             paths, raises_on_error, max_num_pages, max_file_size
         ):
-            if result.status == ConversionStatus.SUCCESS:
-                output = self.__export_result(
-                    result.document, modalities, markdown_options
-                )
+            if result.status != ConversionStatus.SUCCESS:
+                raise ValueError(f"Failed to parse the document: {result.errors}")
 
-                data.append(output)
+            future = executor.submit(
+                self.__export_result,
+                result.document,
+                modalities,
+                markdown_options,
+                table_formats,
+            )
+            if pending is not None:
+                yield pending.result()
+            pending = future
 
-            else:
-                raise ValueError(f"Failed to parse the document: {result.errors}")
-        return data
+        if pending is not None:
+            yield pending.result()
+
+    def _iter_parse_parallel(
+        self,
+        paths: list[str],
+        modalities: list[str],
+        parse_options: dict,
+        num_workers: int,
+    ) -> Generator[ParserOutput, None, None]:
+        """
+        Parse the documents in worker processes, each with its own converter.
+
+        Every worker builds its converter once, then takes documents one at a time,
+        so a long document does not hold back a whole batch of short ones. The pool
+        is kept on the parser, so later calls reuse the workers and their models.
+        ConversionResult objects keep the PDF backend open and cannot be sent between
+        processes, so the workers return the exported outputs instead.
+
+        Args:
+            paths (List[str]): List of paths to the documents
+            modalities (List[str]): List of modalities to extract
+            parse_options (dict): Keyword arguments to pass to the parse method
+            num_workers (int): Number of worker processes
+
+        Returns:
+            data (Generator[ParserOutput, None, None]): Generator of ParserOutput objects, in the order of paths
+        """
+        executor = self._get_process_pool(num_workers)
+        yield from executor.map(
+            _parse_path, paths, repeat(modalities), repeat(parse_options)
+        )
 
     def __export_result(
         self,
         document: DoclingDocument,
         modalities: list[str],
         markdown_options: dict,
+        table_formats: list[str] | None = None,
     ) -> ParserOutput:
         """
         Export the result the ParserOutput object.
@@ -214,81 +760,157 @@ class DoclingPDFParser:
             document (DoclingDocument): DoclingDocument object
             modalities (List[str]): List of modalities to extract
             markdown_options (dict): Options to pass to the export_to_markdown method
+            table_formats (List[str], optional): Table representations to build. Defaults to ["markdown", "dataframe"].
 
         Returns:
             output (ParserOutput): ParserOutput object
         """
         text = TextElement(text="")
-        tables: list[TableElement] = []
-        images: list[ImageElement] = []
+        want_text = "text" in modalities
+        want_tables = "tables" in modalities
+        want_images = "images" in modalities
+
+        table_items: list[TableItem] = []
+        picture_items: list[PictureItem] = []
+        markdown_params = self._markdown_params(markdown_options) if want_text else None
+        if markdown_params is not None:
+            # The markdown serializer walks the whole tree anyway, so the tables and
+            # pictures are collected on the way instead of walking it a second time
+            text, table_items, picture_items = self._single_pass(
+                document, markdown_params
+            )
+            if not want_tables:
+                table_items = []
+            if not want_images:
+                picture_items = []
+
+        else:
+            if want_text:
+                text = self._extract_text(document, markdown_options)
+
+            if want_tables and want_images:
+                # A single walk over the tree collects both kinds of items in reading order
+                for item, _ in document.iterate_items():
+                    if isinstance(item, TableItem):
+                        table_items.append(item)
+
+                    elif isinstance(item, PictureItem):
+                        picture_items.append(item)
+
+            # A single modality reads the document's flat item lists instead of walking the tree
+            elif want_tables:
+                table_items = document.tables
+
+            elif want_images:
+                picture_items = document.pictures
+
+        tables = [self._extract_table(item, table_formats) for item in table_items]
+        images = [
+            image
+            for image in (self._extract_image(item, document) for item in picture_items)
+            if image is not None
+        ]
 
-        if "text" in modalities:
-            text = self._extract_text(document, markdown_options)
+        return ParserOutput(text=text, tables=tables, images=images)
 
-        if any(modality in modalities for modality in ["tables", "images"]):
-            for item, _ in document.iterate_items():
-                if "tables" in modalities and isinstance(item, TableItem):
-                    tables += self._extract_tables(item)
+    @staticmethod
+    def _markdown_params(markdown_options: dict) -> MarkdownParams | None:
+        """
+        Build the markdown serializer parameters equivalent to the export_to_markdown options.
+
+        Args:
+            markdown_options (dict): Options to pass to the export_to_markdown method
 
-                if "images" in modalities and isinstance(item, PictureItem):
-                    images += self._extract_images(item, document)
+        Returns:
+            params (MarkdownParams | None): The parameters, or None if an option has no direct counterpart (e.g. page_no or image_dir), in which case export_to_markdown must be used
+        """
+        fields = MarkdownParams.model_fields
+        if any(
+            key not in fields or value is None
+            for key, value in markdown_options.items()
+        ):
+            return None
+        return MarkdownParams(**markdown_options)
 
-        return ParserOutput(text=text, tables=tables, images=images)
+    @staticmethod
+    def _single_pass(
+        document: DoclingDocument, markdown_params: MarkdownParams
+    ) -> tuple[TextElement, list[TableItem], list[PictureItem]]:
+        """
+        Serialize the document to markdown and collect its tables and pictures in the same walk over the tree.
+
+        Args:
+            document (DoclingDocument): DoclingDocument object
+            markdown_params (MarkdownParams): Parameters of the markdown serializer
+
+        Returns:
+            result (Tuple[TextElement, List[TableItem], List[PictureItem]]): The text, and the table and picture items in reading order
+        """
+        serializer = _ItemCollectingSerializer(doc=document, params=markdown_params)
+        text = serializer.serialize().text
+        return TextElement(text=text), serializer.table_items, serializer.picture_items
 
     @staticmethod
-    def _extract_tables(item: TableItem) -> list[TableElement]:
+    def _extract_table(
+        item: TableItem, table_formats: list[str] | None = None
+    ) -> TableElement:
         """
-        Extract the tables from the TableItem object.
+        Extract the table from the TableItem object.
 
         Args:
             item (TableItem): TableItem object
+            table_formats (List[str], optional): Table representations to build, among "markdown" and "dataframe". Defaults to both.
 
         Returns:
-            tables (List[TableElement]): List of TableElement objects
+            table (TableElement): TableElement object
 
         Examples:
         !!! example
             ```python
             parser = DoclingPDFParser()
-            table = parser._extract_tables(table_item)[0]
+            table = parser._extract_table(table_item)
             table_md = table.markdown
             table_df = table.dataframe
             page_number = table.metadata.page_number
             bbox = table.metadata.bbox
             ```
         """
-        table_md: str = item.export_to_markdown()
-        table_df: pd.DataFrame = item.export_to_dataframe()
+        if table_formats is None:
+            table_formats = TABLE_FORMATS
+        table_md: str | None = (
+            item.export_to_markdown() if "markdown" in table_formats else None
+        )
+        table_df: pd.DataFrame | None = (
+            item.export_to_dataframe() if "dataframe" in table_formats else None
+        )
 
         page_no = item.prov[0].page_no
         bbox = item.prov[0].bbox
         bbox = (bbox.l, bbox.t, bbox.r, bbox.b)
 
-        return [
-            TableElement(
-                markdown=table_md,
-                dataframe=table_df,
-                metadata=Metadata(page_number=page_no, bbox=bbox),
-            )
-        ]
+        return TableElement(
+            markdown=table_md,
+            dataframe=table_df,
+            metadata=Metadata(page_number=page_no, bbox=bbox),
+        )
 
     @staticmethod
-    def _extract_images(item: PictureItem, doc: DoclingDocument) -> list[ImageElement]:
+    def _extract_image(item: PictureItem, doc: DoclingDocument) -> ImageElement | None:
         """
-        Extract the images from the PictureItem object.
+        Extract the image from the PictureItem object.
 
         Args:
             item (PictureItem): PictureItem object
             doc (DoclingDocument): DoclingDocument object
 
         Returns:
-            images (List[ImageElement]): List of ImageElement objects
+            image (Optional[ImageElement]): ImageElement object, or None if the picture has no image
 
         Examples:
         !!! example
             ```python
             parser = DoclingPDFParser()
-            image = parser._extract_images(picture_item, doc)[0]
+            image = parser._extract_image(picture_item, doc)
             image_obj = image.image
             page_number = image.metadata.page_number
             bbox = image.metadata.bbox
@@ -296,13 +918,13 @@ class DoclingPDFParser:
         """
         image: Image.Image = item.get_image(doc)
         if image is None:
-            return []
+            return None
         page_no = item.prov[0].page_no
         bbox = item.prov[0].bbox
         bbox = (bbox.l, bbox.t, bbox.r, bbox.b)
-        return [
-            ImageElement(image=image, metadata=Metadata(page_number=page_no, bbox=bbox))
-        ]
+        return ImageElement(
+            image=image, metadata=Metadata(page_number=page_no, bbox=bbox)
+        )
 
     def _extract_text(
         self,
@@ -312,6 +934,10 @@ class DoclingPDFParser:
         """
         Extract the text from the DoclingDocument object.
 
+        With ImageRefMode.EMBEDDED, pictures are embedded from the base64 PNG data
+        URIs Docling stores during conversion (generate_picture_images=True), so the
+        images are not encoded again here.
+
         Args:
             item (DoclingDocument): DoclingDocument object
             markdown_options (dict): Options to pass to the export_to_markdown method
@@ -1,6 +1,11 @@
 import io
 import os
+import tempfile
+import weakref
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from itertools import chain
 
 import pandas as pd
 from dotenv import load_dotenv
@@ -14,11 +19,41 @@ from .schemas import ImageElement, Metadata, ParserOutput, TableElement, TextEle
 load_dotenv()
 logger = get_logger("parsers.llama")
 
+# CSV tables at least this large are read with the multithreaded pyarrow engine
+# when it is installed; pandas' C engine starts faster on small tables
+PYARROW_MIN_CSV_SIZE = 64 * 1024
+PYARROW_AVAILABLE = find_spec("pyarrow") is not None
+
+# The engines infer column types differently, so every cell is read as a string and
+# only empty cells are missing; both engines then build the same DataFrame
+CSV_READ_OPTIONS = {
+    "sep": ",",
+    "dtype": str,
+    "keep_default_na": False,
+    "na_values": [""],
+}
+
+# Maximum number of images decoded concurrently; Pillow releases the GIL while decoding
+IMAGE_DECODE_WORKERS = min(8, os.cpu_count() or 1)
+
+# Representations built for each extracted table
+TABLE_FORMATS = ["markdown", "dataframe"]
+
 
 class LlamaPDFParser:
     """
     Parse a PDF file using the LlamaParse library.
 
+    Each parser builds its own LlamaParse converter. A converter holds a single
+    asynchronous HTTP client, which must not be used from several event loops at
+    once, so converters are not shared between parser instances.
+
+    Images are downloaded on the calling thread, then decoded on a thread pool
+    created on first use and reused by later calls. Call close(), or use the parser
+    as a context manager, to shut it down when the parser is no longer needed;
+    otherwise it is shut down when the parser is garbage collected or at
+    interpreter exit.
+
     Args:
         llama_options (Optional[Dict], optional): A dictionary containing the options for the LlamaParse converter.
 
@@ -48,8 +83,13 @@ class LlamaPDFParser:
                     "is_formatting_instruction": False,
                     "premium_mode": True,
                     "verbose": False,
+                    # Number of files parsed concurrently by get_json_result
+                    "num_workers": 8,
                 }
             self.converter = LlamaParse(api_key=api_key, **llama_options)
+            self._pool: ThreadPoolExecutor | None = None
+            # Shut the pool down if the parser is dropped without being closed
+            self._pool_finalizer: weakref.finalize | None = None
         except ValueError as e:
             # Re-raise ValueError for missing API key or invalid configuration
             raise e
@@ -58,20 +98,110 @@ class LlamaPDFParser:
                 f"Failed to initialize LlamaParse converter: {e}"
             ) from e
 
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool used to decode images, creating it on first use.
+
+        Returns:
+            pool (ThreadPoolExecutor): The thread pool of the parser
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=IMAGE_DECODE_WORKERS,
+                thread_name_prefix="parsestudio-llama",
+            )
+            self._pool_finalizer = weakref.finalize(self, self._pool.shutdown)
+        return self._pool
+
+    def close(self) -> None:
+        """
+        Shut down the thread pool of the parser. It is recreated if the parser is used again.
+        """
+        if self._pool_finalizer is not None:
+            self._pool_finalizer()
+            self._pool_finalizer = None
+        self._pool = None
+
+    def __enter__(self) -> "LlamaPDFParser":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def load_documents(self, paths: list[str]) -> Generator[dict, None, None]:
         """
         Load the documents from the given paths and yield the JSON result.
 
+        All files are sent in a single get_json_result call, which parses up to
+        num_workers files concurrently (see llama_options).
+
         Args:
             paths (List[str]): A list of paths to the PDF files.
 
         Yields:
             result (Generator[Dict, None, None]): A generator that yields the JSON result of the document.
+
+        Raises:
+            ValueError: If some of the paths are not existing files
         """
+        self._validate_paths(paths)
 
         document: list[dict] = self.converter.get_json_result(paths)
         yield from document
 
+    @staticmethod
+    def _validate_paths(paths: list[str]) -> None:
+        """
+        Check that all the paths are existing files before uploading any of them.
+
+        Paths that share a directory are checked with a single directory listing
+        rather than one stat call per file.
+
+        Args:
+            paths (List[str]): A list of paths to the PDF files.
+
+        Raises:
+            ValueError: If some of the paths are not existing files, listing all of them
+        """
+        paths_by_dir: dict[str, list[str]] = {}
+        for path in paths:
+            paths_by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+        invalid_paths: list[str] = []
+        for directory, dir_paths in paths_by_dir.items():
+            if len(dir_paths) == 1:
+                if not os.path.isfile(dir_paths[0]):
+                    invalid_paths.append(dir_paths[0])
+                continue
+            try:
+                with os.scandir(directory or ".") as entries:
+                    files = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                files = set()
+            invalid_paths.extend(
+                path for path in dir_paths if os.path.basename(path) not in files
+            )
+
+        if invalid_paths:
+            raise ValueError(f"Invalid paths, files not found: {invalid_paths}")
+
+    @staticmethod
+    def _validate_table_formats(table_formats: list[str]) -> None:
+        """
+        Validate the table formats provided by the user. The valid formats are: ["markdown", "dataframe"]
+
+        Args:
+            table_formats (List[str]): List of table formats to validate
+
+        Raises:
+            ValueError: If the table format is not valid
+        """
+        for table_format in table_formats:
+            if table_format not in TABLE_FORMATS:
+                raise ValueError(
+                    f"Invalid table format: {table_format}. The valid table formats are: {TABLE_FORMATS}"
+                )
+
     def _validate_modalities(self, modalities: list[str]) -> None:
         """
         Validate the modalities provided by the user. The valid modalities are: ["text", "tables", "images"]
@@ -93,6 +223,7 @@ class LlamaPDFParser:
         self,
         paths: str | list[str],
         modalities: list[str] | None = None,
+        table_formats: list[str] | None = None,
     ) -> list[ParserOutput]:
         """
         Parse the PDF file and return the extracted the specified modalities.
@@ -100,12 +231,13 @@ class LlamaPDFParser:
         Args:
             paths (Union[str, List[str]]): A path or a list of paths to the PDF files.
             modalities (List[str], optional): List of modalities to extract. Defaults to ["text", "tables", "images"].
+            table_formats (List[str], optional): Table representations to build, among "markdown" and "dataframe". Defaults to both. Pass ["markdown"] to skip parsing the CSV of each table into a DataFrame.
 
         Returns:
             data (List[ParserOutput]): A list of ParserOutput objects containing the extracted modalities.
 
         Raises:
-            ValueError: If the modality is not valid
+            ValueError: If the modality or the table format is not valid
 
         Example:
         !!! example
@@ -144,24 +276,33 @@ class LlamaPDFParser:
         if modalities is None:
             modalities = ["text", "tables", "images"]
         self._validate_modalities(modalities)
+        if table_formats is None:
+            table_formats = TABLE_FORMATS
+        self._validate_table_formats(table_formats)
 
         if isinstance(paths, str):
             paths = [paths]
 
         data = []
         for result in self.load_documents(paths):
-            output = self.__export_result(result, modalities)
+            output = self.__export_result(result, modalities, table_formats)
             data.append(output)
 
         return data
 
-    def __export_result(self, json_result: dict, modalities: list[str]) -> ParserOutput:
+    def __export_result(
+        self,
+        json_result: dict,
+        modalities: list[str],
+        table_formats: list[str] | None = None,
+    ) -> ParserOutput:
         """
         Export the result to the ParserOutput object.
 
         Args:
             json_result (dict): The JSON result of the document.
             modalities (List[str]): List of modalities to extract.
+            table_formats (List[str], optional): Table representations to build. Defaults to ["markdown", "dataframe"].
 
         Returns:
             output (ParserOutput): The ParserOutput object containing the extracted modalities.
@@ -173,15 +314,19 @@ class LlamaPDFParser:
         job_id: str = json_result["job_id"]
         pages: list[dict] = json_result["pages"]
 
-        for page in pages:
-            if "text" in modalities:
-                text.text += self._extract_text(page).text + "\n"
+        if "text" in modalities:
+            page_texts = [self._extract_text(page).text for page in pages]
+            text = TextElement(text="\n".join(page_texts) + "\n" if page_texts else "")
 
-            if "tables" in modalities:
-                tables += self._extract_tables(page)
+        if "tables" in modalities:
+            tables = list(
+                chain.from_iterable(
+                    self._extract_tables(page, table_formats) for page in pages
+                )
+            )
 
-            if "images" in modalities:
-                images += self._extract_images(page, job_id)
+        if "images" in modalities and pages:
+            images = self._extract_images(pages, job_id)
 
         return ParserOutput(text=text, tables=tables, images=images)
 
@@ -207,12 +352,15 @@ class LlamaPDFParser:
         return TextElement(text=page["text"])
 
     @staticmethod
-    def _extract_tables(page: dict) -> list[TableElement]:
+    def _extract_tables(
+        page: dict, table_formats: list[str] | None = None
+    ) -> list[TableElement]:
         """
         Extract the tables from the page dict.
 
         Args:
             page (Dict): A dictionary containing the page information.
+            table_formats (List[str], optional): Table representations to build, among "markdown" and "dataframe". Defaults to both.
 
         Returns:
             tables (List[TableElement]): List of TableElement objects
@@ -228,43 +376,74 @@ class LlamaPDFParser:
             bbox = table.metadata.bbox
             ```
         """
+        if table_formats is None:
+            table_formats = TABLE_FORMATS
+        want_markdown = "markdown" in table_formats
+        want_dataframe = "dataframe" in table_formats
+
         tables: list[TableElement] = []
         for item in page["items"]:
             if item["type"] == "table":
-                table_md = item["md"]
-                try:
-                    table_df = pd.read_csv(io.StringIO(item["csv"]), sep=",")
-                except (
-                    pd.errors.EmptyDataError,
-                    pd.errors.ParserError,
-                    ValueError,
-                ) as e:
-                    logger.warning(
-                        "Table parsing failed - malformed data",
-                        extra={"error": str(e), "parser": "llama"},
-                    )
-                except Exception as e:
-                    logger.error(
-                        "Unexpected error converting table to dataframe",
-                        extra={"error": str(e), "parser": "llama"},
-                    )
-                    table_df = None
-
                 tables.append(
                     TableElement(
-                        markdown=table_md,
-                        dataframe=table_df,
+                        markdown=item["md"] if want_markdown else None,
+                        dataframe=(
+                            LlamaPDFParser._read_csv_table(item["csv"])
+                            if want_dataframe
+                            else None
+                        ),
                         metadata=Metadata(page_number=page["page"]),
                     )
                 )
         return tables
 
-    def _extract_images(self, page: dict, job_id: str) -> list[ImageElement]:
+    @staticmethod
+    def _read_csv_table(table_csv: str) -> pd.DataFrame | None:
         """
-        Extract the images from the page dict.
+        Build the DataFrame of a table from its CSV representation.
 
         Args:
-            page (Dict): A dictionary containing the page information.
+            table_csv (str): The CSV representation of the table.
+
+        Returns:
+            table_df (Optional[pd.DataFrame]): The DataFrame of string cells, empty cells being missing, or None if the CSV could not be parsed.
+        """
+        engine = (
+            "pyarrow"
+            if PYARROW_AVAILABLE and len(table_csv) >= PYARROW_MIN_CSV_SIZE
+            else "c"
+        )
+        try:
+            return pd.read_csv(
+                io.StringIO(table_csv), engine=engine, **CSV_READ_OPTIONS
+            )
+        except (
+            pd.errors.EmptyDataError,
+            pd.errors.ParserError,
+            ValueError,
+        ) as e:
+            logger.warning(
+                "Table parsing failed - malformed data",
+                extra={"error": str(e), "parser": "llama"},
+            )
+        except Exception as e:
+            logger.error(
+                "Unexpected error converting table to dataframe",
+                extra={"error": str(e), "parser": "llama"},
+            )
+        return None
+
+    def _extract_images(self, pages: list[dict], job_id: str) -> list[ImageElement]:
+        """
+        Extract the images from the page dicts of a document.
+
+        The images of all the pages are downloaded with a single get_images call on
+        the calling thread. LlamaParse runs it in an event loop with an HTTP client
+        that belongs to the converter, so it must not be called from several threads
+        at once. Only the decoding runs on the thread pool.
+
+        Args:
+            pages (List[Dict]): The dictionaries containing the page information.
             job_id (str): The job_id of the document.
 
         Returns:
@@ -274,21 +453,46 @@ class LlamaPDFParser:
         !!! example
             ```python
             parser = LlamaPDFParser()
-            image = parser._extract_images(page, job_id)[0]
+            image = parser._extract_images(pages, job_id)[0]
             image_obj = image.image
             page_number = image.metadata.page_number
             bbox = image.metadata.bbox
             ```
         """
-        images: list[ImageElement] = []
-        image_dicts = self.converter.get_images(
-            [{"job_id": job_id, "pages": [page]}], download_path="llama_images"
-        )
-        for img in image_dicts:
-            image_path = img["path"]
-            image = Image.open(image_path).convert("RGB")
-            images.append(
-                ImageElement(image=image, metadata=Metadata(page_number=page["page"]))
+        # LlamaParse only downloads images to disk; a temporary directory keeps them
+        # out of the working directory and is removed in one go afterwards
+        with tempfile.TemporaryDirectory(prefix="llama_images_") as download_path:
+            image_dicts = self.converter.get_images(
+                [{"job_id": job_id, "pages": pages}], download_path=download_path
             )
-            os.remove(image_path)
-        return images
+            paths = [img["path"] for img in image_dicts]
+            if len(paths) > 1:
+                decoded = list(self._get_pool().map(self._open_image, paths))
+            else:
+                decoded = [self._open_image(path) for path in paths]
+
+        return [
+            ImageElement(image=image, metadata=Metadata(page_number=img["page_number"]))
+            for img, image in zip(image_dicts, decoded, strict=True)
+        ]
+
+    @staticmethod
+    def _open_image(path: str) -> Image.Image:
+        """
+        Decode an image file to RGB.
+
+        Args:
+            path (str): Path to the image file
+
+        Returns:
+            image (Image.Image): The RGB image
+        """
+        image = Image.open(path)
+        if image.mode == "RGB":
+            # Converting would only copy the pixel buffer; load reads the pixels and
+            # closes the file, so it is not needed afterwards
+            image.load()
+            return image
+        # convert loads the pixels, so the file is not needed afterwards
+        with image:
+            return image.convert("RGB")
@@ -1,7 +1,12 @@
+import hashlib
 import json
 import os
+import threading
 import time
-from collections.abc import Generator
+from collections import OrderedDict, deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -13,12 +18,21 @@ if TYPE_CHECKING:
 else:
     AssistantToolParam = Any
 
+if TYPE_CHECKING:
+    from json import loads as json_loads
+else:
+    try:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers still apply
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
 import openai
 import pandas as pd
 import srsly
 from dotenv import load_dotenv
 from jinja2 import Template
-from openai import OpenAI
+from openai import DefaultHttpxClient, OpenAI
 
 from parsestudio.logging_config import get_logger
 
@@ -30,6 +44,35 @@ logger = get_logger("parsers.openai_assistant")
 
 OPENAI_EXTRACTION_TEMPLATE = read_template("openai_extraction")
 
+# Files below this size are sent straight to the model when tables are not needed
+DIRECT_INPUT_MAX_BYTES = 1_000_000
+
+# HTTP/2 lets the concurrent requests of a parser share one connection; it needs
+# the h2 package (httpx[http2]), so HTTP/1.1 is used when it is not installed
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Read buffer for uploads; the SDK streams file objects to the request body
+UPLOAD_BUFFER_SIZE = 1 << 20
+
+# Documents processed at once; each mostly waits on OpenAI round trips, so threads
+# overlap the latency of several documents while staying well below rate limits
+MAX_CONCURRENT_DOCUMENTS = 4
+
+# Bounds of the run status polling interval, in seconds; the interval doubles while
+# the run is pending, so short runs are noticed quickly and long ones polled rarely
+POLL_INTERVAL_MIN = 0.25
+POLL_INTERVAL_MAX = 4.0
+
+# Number of analyzed documents kept by content, so parsing the same PDF again, e.g.
+# with other modalities, does not upload and analyze it again
+DOCUMENT_CACHE_SIZE = 128
+
+# Modalities that can be requested
+VALID_MODALITIES = frozenset({"text", "tables", "images"})
+
+# Representations built for each extracted table
+TABLE_FORMATS = ["markdown", "dataframe"]
+
 
 def _load_extraction_function_tool() -> dict[str, Any]:
     """Load JSON schema and convert to function tool definition."""
@@ -54,8 +97,38 @@ def _load_extraction_function_tool() -> dict[str, Any]:
 EXTRACTION_FUNCTION_TOOL = _load_extraction_function_tool()
 
 
+def _split_markdown_rows(lines: list[str]) -> list[list[str]]:
+    """Split GitHub-style markdown table lines into cells, dropping empty rows."""
+    split = str.split
+    strip = str.strip
+    rows = [[strip(c) for c in split(strip(ln, "|"), "|")] for ln in lines]
+    return [cells for cells in rows if any(cells)]
+
+
 class OpenAIAssistantPDFParser:
-    def __init__(self, openai_options: dict[str, Any] | None = None):
+    # Clients by API key, so parsers share connection pools instead of opening new ones
+    _CLIENT_CACHE: dict[str, OpenAI] = {}
+    # Assistant IDs by (API key, configured assistant ID, model, instructions), so a
+    # new parser does not create or update the same assistant again
+    _ASSISTANT_CACHE: dict[tuple[str, str | None, str, str], str] = {}
+    # Analysis results by (content digest, assistant ID, OpenAI options, whether
+    # tables were extracted); documents are processed on several threads, so access
+    # goes through the lock
+    _DOCUMENT_CACHE: OrderedDict[tuple[str, str | None, str, bool], dict[str, Any]] = (
+        OrderedDict()
+    )
+    _DOCUMENT_CACHE_LOCK = threading.Lock()
+
+    def __init__(
+        self,
+        openai_options: dict[str, Any] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_DOCUMENTS,
+    ):
+        if max_concurrency < 1:
+            raise ValueError(
+                f"Invalid max concurrency: {max_concurrency}. It must be at least 1"
+            )
+        self.max_concurrency = max_concurrency
         # Sensible defaults for Assistant API
         defaults = {"model": "gpt-4o", "temperature": 0}
         self.options = {**defaults, **(openai_options or {})}
@@ -63,9 +136,17 @@ class OpenAIAssistantPDFParser:
             api_key = os.environ.get("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY environment variable is required")
-            self.client = OpenAI(api_key=api_key)
+            client = self._CLIENT_CACHE.get(api_key)
+            if client is None:
+                client = OpenAI(
+                    api_key=api_key,
+                    # Keeps the SDK's default timeouts and connection limits
+                    http_client=DefaultHttpxClient(http2=HTTP2_AVAILABLE),
+                )
+                self._CLIENT_CACHE[api_key] = client
+            self.client = client
+            self._api_key = api_key
             self.assistant_id: str | None = os.environ.get("ASSISTANT_ID_PARSER2")
-            self.vector_store_id: str | None = None  # Will be created for file search
         except ValueError as e:
             # Re-raise ValueError for missing API key or invalid configuration
             raise e
@@ -76,8 +157,13 @@ class OpenAIAssistantPDFParser:
         self._initialize_assistant()
 
     def _initialize_assistant(self) -> None:
-        """Initialize or create the OpenAI Assistant."""
+        """Initialize or create the OpenAI Assistant, reusing one set up earlier."""
         instructions = Template(OPENAI_EXTRACTION_TEMPLATE).render()
+        key = (self._api_key, self.assistant_id, self.options["model"], instructions)
+        assistant_id = self._ASSISTANT_CACHE.get(key)
+        if assistant_id is not None:
+            self.assistant_id = assistant_id
+            return
 
         if not self.assistant_id:
             self._create_assistant(instructions)
@@ -92,6 +178,68 @@ class OpenAIAssistantPDFParser:
                 )
                 self._create_assistant(instructions)
 
+        if self.assistant_id is not None:
+            self._ASSISTANT_CACHE[key] = self.assistant_id
+
+    @classmethod
+    def clear_client_cache(cls) -> None:
+        """Drop the cached OpenAI clients and assistant IDs."""
+        cls._CLIENT_CACHE.clear()
+        cls._ASSISTANT_CACHE.clear()
+
+    @classmethod
+    def clear_document_cache(cls) -> None:
+        """Drop the cached analysis results."""
+        with cls._DOCUMENT_CACHE_LOCK:
+            cls._DOCUMENT_CACHE.clear()
+
+    @staticmethod
+    def _file_digest(path: str) -> str | None:
+        """Hash the content of a file, or return None when it cannot be read."""
+        try:
+            with open(path, "rb") as file:
+                return hashlib.file_digest(file, "sha256").hexdigest()
+        except OSError:
+            # The upload reports the error; the document is just not cached
+            return None
+
+    def _options_key(self) -> str:
+        """Describe the OpenAI options, which all affect the analysis of a document."""
+        # Options may hold unhashable values, so compare their sorted representation
+        return repr(sorted(self.options.items()))
+
+    def _get_cached_result(self, digest: str, text_only: bool) -> dict[str, Any] | None:
+        """
+        Get the cached analysis of a document, if any.
+
+        A result with tables also serves text-only requests, but a text-only result
+        cannot serve a request for tables.
+        """
+        options_key = self._options_key()
+        keys = [(digest, self.assistant_id, options_key, True)]
+        if text_only:
+            keys.append((digest, self.assistant_id, options_key, False))
+        with self._DOCUMENT_CACHE_LOCK:
+            for key in keys:
+                result = self._DOCUMENT_CACHE.get(key)
+                if result is not None:
+                    self._DOCUMENT_CACHE.move_to_end(key)
+                    return result
+        return None
+
+    def _cache_result(
+        self, digest: str, with_tables: bool, result: dict[str, Any]
+    ) -> None:
+        """Cache the analysis of a document, evicting the least recently used one."""
+        # Empty results are what failed analyses return, so they are not kept
+        if not result.get("text_content") and not result.get("tables"):
+            return
+        key = (digest, self.assistant_id, self._options_key(), with_tables)
+        with self._DOCUMENT_CACHE_LOCK:
+            self._DOCUMENT_CACHE[key] = result
+            if len(self._DOCUMENT_CACHE) > DOCUMENT_CACHE_SIZE:
+                self._DOCUMENT_CACHE.popitem(last=False)
+
     def _create_assistant(self, instructions: str) -> None:
         """Create a new OpenAI Assistant with file search capabilities."""
         try:
@@ -139,27 +287,19 @@ class OpenAIAssistantPDFParser:
         except Exception as e:
             logger.warning(f"Error updating assistant: {e}")
 
-    def _get_or_create_vector_store(self) -> str:
-        """Create or reuse a vector store for file search."""
-        if self.vector_store_id:
-            return self.vector_store_id
+    def _create_vector_store(self) -> str:
+        """
+        Create a vector store for the file of a single document.
 
+        Each document gets its own store, so documents processed at the same time never
+        search each other's files. The store is not attached to the assistant but to the
+        thread analyzing the document, through its tool resources.
+        """
         try:
             vector_store = self.client.vector_stores.create(
                 name=f"pdf_analysis_{int(time.time())}"
             )
-            self.vector_store_id = str(vector_store.id)
-
-            # Attach vector store to assistant
-            if self.assistant_id is not None:
-                self.client.beta.assistants.update(
-                    assistant_id=self.assistant_id,
-                    tool_resources={
-                        "file_search": {"vector_store_ids": [self.vector_store_id]}
-                    },
-                )
-
-            return self.vector_store_id
+            return str(vector_store.id)
         except openai.AuthenticationError as e:
             raise ValueError(f"Invalid OpenAI API key: {e}") from e
         except openai.RateLimitError as e:
@@ -172,9 +312,12 @@ class OpenAIAssistantPDFParser:
     def _upload_file_to_vector_store(self, file_path: str, vector_store_id: str) -> str:
         """Upload PDF file to OpenAI and add to vector store."""
         try:
-            with open(file_path, "rb") as file:
+            with open(file_path, "rb", buffering=UPLOAD_BUFFER_SIZE) as file:
                 # Upload file for assistants
-                response = self.client.files.create(file=file, purpose="assistants")
+                response = self.client.files.create(
+                    file=(Path(file_path).name, file, "application/pdf"),
+                    purpose="assistants",
+                )
                 file_id = str(response.id)
 
                 # Add file to vector store
@@ -210,28 +353,100 @@ class OpenAIAssistantPDFParser:
                 f"Unexpected error uploading file {file_path}: {e}"
             ) from e
 
-    def _analyze_with_assistant_api(
+    def _upload_file(self, file_path: str) -> str:
+        """Upload PDF file to OpenAI for direct model input."""
+        try:
+            with open(file_path, "rb", buffering=UPLOAD_BUFFER_SIZE) as file:
+                response = self.client.files.create(
+                    file=(Path(file_path).name, file, "application/pdf"),
+                    purpose="user_data",
+                )
+            return str(response.id)
+        except (OSError, FileNotFoundError, PermissionError) as e:
+            raise ValueError(f"File access error for {file_path}: {e}") from e
+        except openai.AuthenticationError as e:
+            raise ValueError(f"Invalid OpenAI API key: {e}") from e
+        except openai.RateLimitError as e:
+            raise RuntimeError(f"OpenAI API rate limit exceeded: {e}") from e
+        except openai.APIError as e:
+            raise RuntimeError(f"OpenAI API error during file upload: {e}") from e
+        except Exception as e:
+            raise RuntimeError(
+                f"Unexpected error uploading file {file_path}: {e}"
+            ) from e
+
+    def _analyze_with_chat_completions(
         self, file_id: str, retries: int = 3
     ) -> dict[str, Any]:
-        """Analyze PDF content using the Assistant API."""
+        """Extract plain text from PDF content with a single chat completion."""
         last_err: Exception | None = None
 
-        instructions = "Extract all text content and tables from the PDF document. Use the extract_pdf_content function to provide the structured output in the specified JSON format."
+        instructions = "Extract all text content from the PDF document. Return only the extracted text as markdown, without any commentary."
 
         for attempt in range(retries):
-            thread_id = None
             try:
-                # Create thread with file attachment
-                thread = self.client.beta.threads.create(
+                response = self.client.chat.completions.create(
+                    model=self.options["model"],
+                    temperature=self.options["temperature"],
                     messages=[
                         {
                             "role": "user",
-                            "content": instructions,
-                            "attachments": [
-                                {"file_id": file_id, "tools": [{"type": "file_search"}]}
+                            "content": [
+                                {"type": "file", "file": {"file_id": file_id}},
+                                {"type": "text", "text": instructions},
                             ],
                         }
-                    ]
+                    ],
+                )
+                content = response.choices[0].message.content or ""
+                return {"text_content": content, "tables": []}
+            except openai.AuthenticationError as e:
+                raise ValueError(f"Invalid OpenAI API key: {e}") from e
+            except openai.RateLimitError as e:
+                last_err = e
+                time.sleep((attempt + 1) * 2.0)
+            except Exception as e:
+                last_err = e
+                logger.warning(
+                    f"Chat completion error on attempt {attempt + 1}",
+                    extra={"error": str(e), "type": type(e).__name__},
+                )
+                time.sleep((attempt + 1) * 1.5)
+
+        logger.warning(
+            "Chat completion analysis failed after retries",
+            extra={"error": str(last_err), "retries": retries},
+        )
+        return {"text_content": "", "tables": []}
+
+    def _analyze_with_assistant_api(
+        self, vector_store_id: str, retries: int = 3, include_tables: bool = True
+    ) -> dict[str, Any]:
+        """
+        Analyze PDF content using the Assistant API.
+
+        The thread searches the given vector store, whose file has already been
+        processed, so the run does not index the document again.
+
+        When include_tables is False, the model is asked to leave the tables out, so
+        no output tokens are spent on tables that would be dropped.
+        """
+        last_err: Exception | None = None
+
+        if include_tables:
+            instructions = "Extract all text content and tables from the PDF document. Use the extract_pdf_content function to provide the structured output in the specified JSON format."
+        else:
+            instructions = "Extract all text content from the PDF document, and return an empty tables array without extracting any table. Use the extract_pdf_content function to provide the structured output in the specified JSON format."
+
+        for attempt in range(retries):
+            thread_id = None
+            try:
+                # Create thread searching the document's vector store
+                thread = self.client.beta.threads.create(
+                    messages=[{"role": "user", "content": instructions}],
+                    tool_resources={
+                        "file_search": {"vector_store_ids": [vector_store_id]}
+                    },
                 )
                 thread_id = thread.id
 
@@ -247,7 +462,7 @@ class OpenAIAssistantPDFParser:
                 # Poll for completion
                 start_time = time.time()
                 max_duration = 180  # 3 minutes
-                poll_interval = 3
+                poll_interval = POLL_INTERVAL_MIN
                 function_call_count = 0
                 last_function_result: dict[str, Any] | None = None
 
@@ -278,7 +493,7 @@ class OpenAIAssistantPDFParser:
                         for tool_call in tool_calls:
                             if tool_call.function.name == "extract_pdf_content":
                                 try:
-                                    args: dict[str, Any] = json.loads(
+                                    args: dict[str, Any] = json_loads(
                                         tool_call.function.arguments
                                     )
                                     last_function_result = args
@@ -311,6 +526,8 @@ class OpenAIAssistantPDFParser:
                                 run_id=run.id,
                                 tool_outputs=tool_outputs,
                             )
+                            # The run resumes right away, so poll closely again
+                            poll_interval = POLL_INTERVAL_MIN
                             continue
 
                     elif run_status.status == "completed":
@@ -331,7 +548,7 @@ class OpenAIAssistantPDFParser:
                             try:
                                 # Try to parse as JSON
                                 if content.startswith("{"):
-                                    parsed_content: dict[str, Any] = json.loads(content)
+                                    parsed_content: dict[str, Any] = json_loads(content)
                                     return parsed_content
                             except json.JSONDecodeError:
                                 pass
@@ -346,6 +563,7 @@ class OpenAIAssistantPDFParser:
                         )
 
                     time.sleep(poll_interval)
+                    poll_interval = min(poll_interval * 2, POLL_INTERVAL_MAX)
 
             except openai.AuthenticationError as e:
                 raise ValueError(f"Invalid OpenAI API key: {e}") from e
@@ -407,45 +625,113 @@ class OpenAIAssistantPDFParser:
         except Exception as e:
             logger.warning("Resource cleanup failed", extra={"error": str(e)})
 
-    def load_documents(self, paths: list[str]) -> Generator[dict[str, Any], None, None]:
-        """Load and analyze PDF documents using OpenAI Assistant API with file search."""
-        for path in paths:
-            file_ids = []
-            vector_store_id = None
-
+    def load_documents(
+        self, paths: list[str], modalities: list[str] | None = None
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Load and analyze PDF documents using OpenAI Assistant API with file search.
+
+        When tables are not requested, small files skip the vector store and are
+        sent directly to the model through the chat completions API. Up to
+        max_concurrency documents are processed at once, and results are yielded in
+        the order of the paths. A document is only started once an earlier result
+        has been consumed, so a slow consumer never has more than max_concurrency
+        results pending.
+        """
+        text_only = modalities is not None and "tables" not in modalities
+        if self.max_concurrency == 1 or len(paths) <= 1:
+            for path in paths:
+                yield self._process_document(path, text_only)
+            return
+
+        depth = min(self.max_concurrency, len(paths))
+        with ThreadPoolExecutor(
+            max_workers=depth, thread_name_prefix="parsestudio-openai"
+        ) as executor:
+            pending: deque[Future[dict[str, Any]]] = deque()
             try:
-                # Create vector store
-                vector_store_id = self._get_or_create_vector_store()
+                for path in paths:
+                    pending.append(
+                        executor.submit(self._process_document, path, text_only)
+                    )
+                    if len(pending) >= depth:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                # Documents not started yet are dropped when the consumer stops early
+                for future in pending:
+                    future.cancel()
+
+    def _process_document(self, path: str, text_only: bool = False) -> dict[str, Any]:
+        """
+        Upload and analyze a single PDF document, then delete its OpenAI resources.
 
-                # Upload file to vector store
-                file_id = self._upload_file_to_vector_store(path, vector_store_id)
+        Results are cached by the content of the file, so a document parsed before is
+        not uploaded again. Errors are logged and produce an empty result, so one
+        failing document does not abort the others.
+        """
+        file_ids = []
+        vector_store_id = None
+
+        try:
+            digest = self._file_digest(path)
+            cached = self._get_cached_result(digest, text_only) if digest else None
+            if cached is not None:
+                return cached
+
+            if text_only and os.path.getsize(path) < DIRECT_INPUT_MAX_BYTES:
+                file_id = self._upload_file(path)
                 file_ids.append(file_id)
+                result = self._analyze_with_chat_completions(file_id)
+                if digest:
+                    self._cache_result(digest, False, result)
+                return result
 
-                # Analyze with Assistant API
-                result = self._analyze_with_assistant_api(file_id)
+            # Create vector store
+            vector_store_id = self._create_vector_store()
 
-                yield result
+            # Upload file to vector store
+            file_id = self._upload_file_to_vector_store(path, vector_store_id)
+            file_ids.append(file_id)
 
-            except Exception as e:
-                logger.error(
-                    "Failed to process PDF file",
-                    extra={
-                        "file_path": path,
-                        "error": str(e),
-                        "parser": "openai_assistant",
-                    },
-                )
-                yield {"text_content": "", "tables": []}
+            # Analyze with Assistant API
+            result = self._analyze_with_assistant_api(
+                vector_store_id, include_tables=not text_only
+            )
+            if digest:
+                self._cache_result(digest, not text_only, result)
+            return result
 
-            finally:
-                # Always cleanup resources
-                self._cleanup_resources(file_ids, vector_store_id)
+        except Exception as e:
+            logger.error(
+                "Failed to process PDF file",
+                extra={
+                    "file_path": path,
+                    "error": str(e),
+                    "parser": "openai_assistant",
+                },
+            )
+            return {"text_content": "", "tables": []}
+
+        finally:
+            # Always cleanup resources
+            self._cleanup_resources(file_ids, vector_store_id)
 
     def _validate_modalities(self, modalities: list[str]) -> None:
-        valid = {"text", "tables", "images"}
-        invalid = [m for m in modalities if m not in valid]
+        invalid = frozenset(modalities) - VALID_MODALITIES
         if invalid:
-            raise ValueError(f"Invalid modalities: {invalid}. Valid: {sorted(valid)}")
+            raise ValueError(
+                f"Invalid modalities: {sorted(invalid)}. Valid: {sorted(VALID_MODALITIES)}"
+            )
+
+    @staticmethod
+    def _validate_table_formats(table_formats: list[str]) -> None:
+        invalid = [f for f in table_formats if f not in TABLE_FORMATS]
+        if invalid:
+            raise ValueError(
+                f"Invalid table formats: {invalid}. Valid: {TABLE_FORMATS}"
+            )
 
     def parse(
         self,
@@ -453,31 +739,64 @@ class OpenAIAssistantPDFParser:
         modalities: list[str] | None = None,
         **kwargs: Any,
     ) -> list[ParserOutput]:
+        return list(self.iter_parse(paths, modalities, **kwargs))
+
+    def iter_parse(
+        self,
+        paths: str | list[str],
+        modalities: list[str] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ParserOutput]:
+        """
+        Parse PDF files and yield each output as soon as its document is analyzed.
+
+        Arguments are validated right away; documents are uploaded as the outputs are
+        consumed, at most max_concurrency ahead of the consumer.
+        """
         if modalities is None:
             modalities = ["text", "tables", "images"]
         self._validate_modalities(modalities)
-        # kwargs reserved for future use
+        # table_formats selects the table representations to build, among
+        # "markdown" and "dataframe"; pass ["markdown"] to skip the DataFrames
+        table_formats: list[str] = kwargs.get("table_formats", TABLE_FORMATS)
+        self._validate_table_formats(table_formats)
         if isinstance(paths, str):
             paths = [paths]
-        outputs: list[ParserOutput] = []
-        for result in self.load_documents(paths):
-            outputs.append(self.__export_result(result, modalities))
-        return outputs
+        return self._iter_parse(paths, modalities, table_formats)
+
+    def _iter_parse(
+        self, paths: list[str], modalities: list[str], table_formats: list[str]
+    ) -> Generator[ParserOutput, None, None]:
+        for result in self.load_documents(paths, modalities):
+            yield self.__export_result(result, modalities, table_formats)
 
     def __export_result(
-        self, parsed: dict[str, Any], modalities: list[str]
+        self,
+        parsed: dict[str, Any],
+        modalities: list[str],
+        table_formats: list[str] | None = None,
     ) -> ParserOutput:
         text = (
             TextElement(text=parsed.get("text_content", ""))
             if "text" in modalities
             else TextElement(text="")
         )
-        tables = self._extract_tables(parsed) if "tables" in modalities else []
+        tables = (
+            self._extract_tables(parsed, table_formats)
+            if "tables" in modalities
+            else []
+        )
         images: list[ImageElement] = []  # Assistant API doesn't extract images
         return ParserOutput(text=text, tables=tables, images=images)
 
     @staticmethod
-    def _extract_tables(parsed: dict[str, Any]) -> list[TableElement]:
+    def _extract_tables(
+        parsed: dict[str, Any], table_formats: list[str] | None = None
+    ) -> list[TableElement]:
+        if table_formats is None:
+            table_formats = TABLE_FORMATS
+        want_markdown = "markdown" in table_formats
+        want_dataframe = "dataframe" in table_formats
         out: list[TableElement] = []
         for tbl in parsed.get("tables", []):
             try:
@@ -488,21 +807,20 @@ class OpenAIAssistantPDFParser:
 
                 # Parse GitHub-style markdown table
                 hdr = [c.strip() for c in lines[0].strip("|").split("|")]
-                rows = []
-                for ln in lines[2:]:  # Skip separator line
-                    cells = [c.strip() for c in ln.strip("|").split("|")]
-                    if cells and any(cells):
-                        rows.append(cells)
-
-                df = (
-                    pd.DataFrame(rows, columns=hdr)
-                    if rows
-                    else pd.DataFrame(columns=hdr)
-                )
+                rows = _split_markdown_rows(lines[2:])  # Skip separator line
+                if not rows and not any(hdr):
+                    continue
+                df = None
+                if want_dataframe:
+                    df = (
+                        pd.DataFrame.from_records(rows, columns=hdr)
+                        if rows
+                        else pd.DataFrame(columns=hdr)
+                    )
 
                 out.append(
                     TableElement(
-                        markdown=md,
+                        markdown=md if want_markdown else None,
                         dataframe=df,
                         metadata=Metadata(
                             page_number=tbl.get("page_number", 1),
@@ -1,6 +1,10 @@
+from collections.abc import Iterator
 from typing import Any
 
-from .openai_file_search_parser import OpenAIAssistantPDFParser
+from .openai_file_search_parser import (
+    MAX_CONCURRENT_DOCUMENTS,
+    OpenAIAssistantPDFParser,
+)
 from .schemas import ParserOutput
 
 
@@ -11,10 +15,15 @@ class OpenAIPDFParser:
 
     Args:
         openai_options: Options to pass to the underlying parser
+        max_concurrency: Number of documents processed at once
     """
 
-    def __init__(self, openai_options: dict[str, Any] | None = None):
-        self.parser = OpenAIAssistantPDFParser(openai_options)
+    def __init__(
+        self,
+        openai_options: dict[str, Any] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_DOCUMENTS,
+    ):
+        self.parser = OpenAIAssistantPDFParser(openai_options, max_concurrency)
 
     def parse(
         self,
@@ -35,9 +44,28 @@ class OpenAIPDFParser:
         """
         return self.parser.parse(paths, modalities, **kwargs)
 
-    def load_documents(self, paths: list[str]):
+    def iter_parse(
+        self,
+        paths: str | list[str],
+        modalities: list[str] | None = None,
+        **kwargs,
+    ) -> Iterator[ParserOutput]:
+        """
+        Parse PDF files, yielding each output as soon as its document is analyzed.
+
+        Args:
+            paths: Path or list of paths to PDF files
+            modalities: List of modalities to extract
+            **kwargs: Additional arguments passed to the underlying parser
+
+        Returns:
+            Iterator of ParserOutput objects, in the order of paths
+        """
+        return self.parser.iter_parse(paths, modalities, **kwargs)
+
+    def load_documents(self, paths: list[str], modalities: list[str] | None = None):
         """Load documents using the file search parser."""
-        return self.parser.load_documents(paths)
+        return self.parser.load_documents(paths, modalities)
 
     def _validate_modalities(self, modalities: list[str]) -> None:
         """Validate modalities using the parser."""
@@ -1,40 +1,242 @@
-from collections.abc import Generator
+import multiprocessing
+import os
+from collections import OrderedDict, deque
+from collections.abc import Collection, Generator, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO
+from itertools import islice, repeat
+from typing import TYPE_CHECKING
 
 import fitz  # PyMuPDF
 from fitz import Page
 from PIL import Image
 
+if TYPE_CHECKING:
+    import simplejpeg
+else:
+    try:
+        import simplejpeg
+    except ImportError:
+        simplejpeg = None
+
 from parsestudio.logging_config import get_logger
 
 from .schemas import ImageElement, Metadata, ParserOutput, TableElement, TextElement
 
 logger = get_logger("parsers.pymupdf")
 
+# Start method of the worker processes; spawn behaves the same on every platform and
+# never forks a process that already holds MuPDF or pandas state
+MP_START_METHOD = "spawn"
+
+# Number of consecutive pages handled by a worker per task
+PAGES_PER_TASK = 4
+
+# Worker processes used when num_workers is None and PARSESTUDIO_WORKERS is unset; the
+# speedup flattens out past a few processes since the workers compete for memory bandwidth
+DEFAULT_NUM_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Number of files read ahead of the one being parsed when prefetching
+READ_AHEAD_FILES = 2
+
+# Number of decoded images kept per batch, keyed by their encoded bytes, so images
+# shared by several documents (e.g. the logo of a report series) are decoded once
+DECODE_CACHE_SIZE = 64
+
+# Representations built for each extracted table
+TABLE_FORMATS = ["markdown", "dataframe"]
+
+# Text extraction flags: PyMuPDF's TEXTFLAGS_TEXT defaults without ligature
+# preservation, so ligatures are expanded to plain characters
+TEXT_FLAGS = (
+    fitz.TEXT_PRESERVE_WHITESPACE
+    | fitz.TEXT_MEDIABOX_CLIP
+    | fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
+)
+
+
+def _default_num_workers() -> int:
+    """
+    Get the number of worker processes to use when the caller does not set one.
+
+    The PARSESTUDIO_WORKERS environment variable overrides DEFAULT_NUM_WORKERS, so the
+    worker count can be tuned per deployment without code changes.
+
+    Returns:
+        num_workers (int): The number of worker processes.
+    """
+    value = os.environ.get("PARSESTUDIO_WORKERS")
+    if value is None:
+        return DEFAULT_NUM_WORKERS
+    try:
+        num_workers = int(value)
+    except ValueError:
+        num_workers = 0
+    if num_workers < 1:
+        logger.warning(
+            "Ignoring invalid PARSESTUDIO_WORKERS",
+            extra={"value": value, "parser": "pymupdf"},
+        )
+        return DEFAULT_NUM_WORKERS
+    return num_workers
+
+
+def _iter_pages(doc: fitz.Document) -> Iterator[Page]:
+    """
+    Load the pages of a document one at a time.
+
+    The generator holds no reference to the pages it yielded, so each page, with its
+    parsed content streams, is released as soon as the caller moves on to the next.
+
+    Args:
+        doc (fitz.Document): An open document.
+
+    Returns:
+        pages (Iterator[Page]): The pages of the document, in page order.
+    """
+    for page_num in range(doc.page_count):
+        yield doc.load_page(page_num)
+
+
+def _read_ahead(paths: list[str], depth: int) -> Iterator[bytes]:
+    """
+    Read files on a background thread, keeping up to depth files ahead of the consumer.
+
+    Only plain file reads run on the thread, since PyMuPDF is not thread-safe.
+
+    Args:
+        paths (List[str]): Paths of the files to read.
+        depth (int): Maximum number of files read ahead.
+
+    Returns:
+        contents (Iterator[bytes]): The content of each file, in the order of the paths.
+
+    Raises:
+        OSError: If a file cannot be read.
+    """
+
+    def read(path: str) -> bytes:
+        with open(path, "rb") as file:
+            return file.read()
+
+    with ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="parsestudio-pymupdf-read"
+    ) as executor:
+        pending: deque[Future[bytes]] = deque()
+        remaining = iter(paths)
+        try:
+            for path in remaining:
+                pending.append(executor.submit(read, path))
+                if len(pending) > depth:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _join_pages(page_texts: list[str]) -> str:
+    """
+    Join the text of the pages of a document, ending each page with a newline.
+
+    Args:
+        page_texts (List[str]): The text of each page, in page order.
+
+    Returns:
+        text (str): The text of the document.
+    """
+    return "\n".join(page_texts) + "\n" if page_texts else ""
+
+
+# Decoded images of the worker process, shared by the tasks it runs
+_worker_decode_cache: OrderedDict[bytes, Image.Image] | None = None
+
+
+def _init_worker() -> None:
+    """
+    Set up a worker process: silence MuPDF's stderr output and create its decode cache.
+
+    Each worker would otherwise print the same recoverable syntax errors and
+    warnings of the documents it handles, interleaved with the other workers. The
+    messages stay available through fitz.TOOLS.mupdf_warnings().
+    """
+    global _worker_decode_cache
+    fitz.TOOLS.mupdf_display_errors(False)
+    fitz.TOOLS.mupdf_display_warnings(False)
+    _worker_decode_cache = OrderedDict()
+
+
+def _parse_pages(
+    path: str,
+    page_numbers: range,
+    modalities: Collection[str],
+    table_formats: list[str] | None = None,
+    fast_mode: bool = False,
+) -> list[tuple[str, list[TableElement], list[ImageElement]]]:
+    """
+    Extract the requested modalities from a range of pages of a PDF file.
+
+    Defined at module level so it can be sent to worker processes. Page objects
+    are not picklable, so each task reopens the document from its path.
+
+    Args:
+        path (str): Path to the PDF file.
+        page_numbers (range): Zero-based page numbers to extract.
+        modalities (Collection[str]): Modalities to extract.
+        table_formats (List[str], optional): Table representations to build. Defaults to ["markdown", "dataframe"].
+        fast_mode (bool, optional): Whether to skip table detection on pages without vector graphics. Defaults to False.
+
+    Returns:
+        results (List[Tuple[str, List[TableElement], List[ImageElement]]]): The text, tables and images of each page, in page order.
+    """
+    extract_page = PyMuPDFParser._extract_page
+    image_cache: dict[int, tuple[Image.Image, dict]] = {}
+    with fitz.open(path) as doc:
+        load_page = doc.load_page
+        return [
+            extract_page(
+                load_page(page_num),
+                modalities,
+                table_formats,
+                image_cache,
+                _worker_decode_cache,
+                fast_mode,
+            )
+            for page_num in page_numbers
+        ]
+
 
 class PyMuPDFParser:
     """
     Parse a PDF file using PyMuPDF parser.
+
+    PyMuPDF is not thread-safe, so pages are never extracted on threads: parallel
+    parsing (num_workers > 1) spreads chunks of pages over worker processes, each
+    opening its own copy of the document. This also applies to a single large PDF.
     """
 
     def __init__(self):
         pass
 
     @staticmethod
-    def load_documents(paths: list[str]) -> Generator[list[Page], None, None]:
+    def load_documents(paths: list[str]) -> Generator[Iterator[Page], None, None]:
         """
         Load the documents from the given paths.
 
+        Pages are loaded lazily, one at a time, so only the page being processed is
+        kept alive. Each page iterator must be consumed before advancing to the next
+        document, since the document is closed afterwards.
+
         Args:
             paths (List[str]): List of paths to the PDF files.
 
         Returns:
-            result (Generator[List[Page], None, None]): A generator that yields a list of pages for each document
+            result (Generator[Iterator[Page], None, None]): A generator that yields an iterator over the pages of each document
         """
         for path in paths:
             with fitz.open(path) as doc:
-                pages = [doc.load_page(page_num) for page_num in range(doc.page_count)]
-                yield pages
+                yield _iter_pages(doc)
 
     def _validate_modalities(self, modalities: list[str]) -> None:
         """
@@ -53,10 +255,31 @@ class PyMuPDFParser:
                     f"Invalid modality: {modality}. The valid modalities are: {valid_modalities}"
                 )
 
+    @staticmethod
+    def _validate_table_formats(table_formats: list[str]) -> None:
+        """
+        Validate the table formats provided by the user. The valid formats are: ["markdown", "dataframe"]
+
+        Args:
+            table_formats (List[str]): List of table formats to validate
+
+        Raises:
+            ValueError: If the table format is not valid
+        """
+        for table_format in table_formats:
+            if table_format not in TABLE_FORMATS:
+                raise ValueError(
+                    f"Invalid table format: {table_format}. The valid table formats are: {TABLE_FORMATS}"
+                )
+
     def parse(
         self,
         paths: str | list[str],
         modalities: list[str] | None = None,
+        num_workers: int | None = 1,
+        table_formats: list[str] | None = None,
+        prefetch: bool = False,
+        fast_mode: bool = False,
     ) -> list[ParserOutput]:
         """
         Parse the PDF file and return the extracted the specified modalities.
@@ -64,12 +287,16 @@ class PyMuPDFParser:
         Args:
             paths (Union[str, List[str]]): A path or a list of paths to the PDF files.
             modalities (List[str], optional): List of modalities to extract. Defaults to ["text", "tables", "images"].
+            num_workers (int, optional): Number of worker processes used to extract pages in parallel. The pages of all the documents are spread over the same workers. None uses the PARSESTUDIO_WORKERS environment variable if set, otherwise up to 4 processes depending on the number of CPUs. Processes suit local files, where parsing is CPU-bound; for files on a network mount, where reads dominate, parse sequentially with prefetch=True instead. Defaults to 1, which parses sequentially in the current process. Workers are spawned, so scripts using more than one must guard their entry point with `if __name__ == "__main__":`.
+            table_formats (List[str], optional): Table representations to build, among "markdown" and "dataframe". Defaults to both. Building the DataFrame is the expensive part, so pass ["markdown"] when it is not needed.
+            prefetch (bool, optional): Whether to read the next files on a background thread while a document is parsed, so disk reads overlap with parsing. Each prefetched file is held in memory. Only used when parsing sequentially. Defaults to False.
+            fast_mode (bool, optional): Whether to skip table detection on pages without vector graphics. Table detection looks for ruling lines, so such pages rarely hold tables, and checking for drawings is far cheaper than detecting tables. Tables drawn without any lines can be missed. Defaults to False.
 
         Returns:
             data (List[ParserOutput]): A list of ParserOutput objects containing the extracted modalities.
 
         Raises:
-            ValueError: If the modality is not valid
+            ValueError: If the modality or the table format is not valid
 
         Example:
         !!! example
@@ -108,44 +335,292 @@ class PyMuPDFParser:
         if modalities is None:
             modalities = ["text", "tables", "images"]
         self._validate_modalities(modalities)
+        # Modalities are tested for every page, so use a set
+        modality_set = frozenset(modalities)
+        if table_formats is None:
+            table_formats = TABLE_FORMATS
+        self._validate_table_formats(table_formats)
+
+        if isinstance(paths, str):
+            paths = [paths]
+
+        if num_workers is None:
+            num_workers = _default_num_workers()
+        if num_workers > 1:
+            return self._parse_parallel(
+                paths, modality_set, num_workers, table_formats, fast_mode
+            )
+
+        return list(
+            self._iter_parse(paths, modality_set, table_formats, prefetch, fast_mode)
+        )
+
+    def iter_parse(
+        self,
+        paths: str | list[str],
+        modalities: list[str] | None = None,
+        num_workers: int | None = 1,
+        table_formats: list[str] | None = None,
+        prefetch: bool = False,
+        fast_mode: bool = False,
+    ) -> Iterator[ParserOutput]:
+        """
+        Parse the PDF files one at a time and yield each output as soon as it is built.
+
+        Only the document being parsed is kept in memory, so this suits large batches
+        whose outputs are written out and discarded as they come.
+
+        Args:
+            paths (Union[str, List[str]]): A path or a list of paths to the PDF files.
+            modalities (List[str], optional): List of modalities to extract. Defaults to ["text", "tables", "images"].
+            num_workers (int, optional): Accepted so iter_parse takes the same arguments as parse, but ignored: the files are always parsed sequentially in the current process, so that only one document is held at a time.
+            table_formats (List[str], optional): Table representations to build, among "markdown" and "dataframe". Defaults to both.
+            prefetch (bool, optional): Whether to read the next files on a background thread while a document is parsed. Defaults to False.
+            fast_mode (bool, optional): Whether to skip table detection on pages without vector graphics. Defaults to False.
+
+        Returns:
+            data (Iterator[ParserOutput]): An iterator of ParserOutput objects, in the order of the given paths.
+
+        Raises:
+            ValueError: If the modality or the table format is not valid
+
+        Example:
+        !!! example
+            ```python
+            parser = PyMuPDFParser()
+            for output in parser.iter_parse(["a.pdf", "b.pdf"], modalities=["text"]):
+                save(output.text.text)
+            ```
+        """
+        if modalities is None:
+            modalities = ["text", "tables", "images"]
+        self._validate_modalities(modalities)
+        # Modalities are tested for every page, so use a set
+        modality_set = frozenset(modalities)
+        if table_formats is None:
+            table_formats = TABLE_FORMATS
+        self._validate_table_formats(table_formats)
 
         if isinstance(paths, str):
             paths = [paths]
 
+        return self._iter_parse(paths, modality_set, table_formats, prefetch, fast_mode)
+
+    def _iter_parse(
+        self,
+        paths: list[str],
+        modalities: Collection[str],
+        table_formats: list[str],
+        prefetch: bool = False,
+        fast_mode: bool = False,
+    ) -> Generator[ParserOutput, None, None]:
+        """
+        Parse the PDF files sequentially, yielding one output per file.
+
+        Args:
+            paths (List[str]): List of paths to the PDF files.
+            modalities (Collection[str]): Modalities to extract.
+            table_formats (List[str]): Table representations to build.
+            prefetch (bool, optional): Whether to read the next files ahead on a background thread.
+            fast_mode (bool, optional): Whether to skip table detection on pages without vector graphics.
+
+        Returns:
+            data (Generator[ParserOutput, None, None]): A generator of ParserOutput objects
+        """
+        decode_cache: OrderedDict[bytes, Image.Image] = OrderedDict()
+        if prefetch and len(paths) > 1:
+            for content in _read_ahead(paths, READ_AHEAD_FILES):
+                with fitz.open(stream=content, filetype="pdf") as doc:
+                    yield self.__export_result(
+                        _iter_pages(doc),
+                        modalities,
+                        table_formats,
+                        decode_cache,
+                        fast_mode,
+                    )
+            return
+
+        for path in paths:
+            # Keep the document open while its pages are exported and close it
+            # right after, even if the export fails
+            with fitz.open(path) as doc:
+                yield self.__export_result(
+                    _iter_pages(doc), modalities, table_formats, decode_cache, fast_mode
+                )
+
+    @staticmethod
+    def _parse_parallel(
+        paths: list[str],
+        modalities: Collection[str],
+        num_workers: int,
+        table_formats: list[str] | None = None,
+        fast_mode: bool = False,
+    ) -> list[ParserOutput]:
+        """
+        Parse the PDF files by distributing their pages over a pool of worker processes.
+
+        The tasks of all the documents are submitted at once, so workers do not wait
+        for the last pages of one document before starting on the next. Large batches
+        send several tasks to a worker per round trip, about four batches per worker,
+        to amortize the inter-process overhead. Work that fits in a single task is done
+        in the current process, without starting a pool.
+
+        Args:
+            paths (List[str]): List of paths to the PDF files.
+            modalities (Collection[str]): Modalities to extract.
+            num_workers (int): Number of worker processes.
+            table_formats (List[str], optional): Table representations to build.
+            fast_mode (bool, optional): Whether to skip table detection on pages without vector graphics.
+
+        Returns:
+            data (List[ParserOutput]): A list of ParserOutput objects, in the order of the given paths.
+        """
+        task_paths: list[str] = []
+        task_chunks: list[range] = []
+        task_counts: list[int] = []
+        for path in paths:
+            with fitz.open(path) as doc:
+                page_count = doc.page_count
+            chunks = [
+                range(start, min(start + PAGES_PER_TASK, page_count))
+                for start in range(0, page_count, PAGES_PER_TASK)
+            ]
+            task_paths.extend(repeat(path, len(chunks)))
+            task_chunks.extend(chunks)
+            task_counts.append(len(chunks))
+
+        if len(task_chunks) <= 1:
+            results = iter(
+                [
+                    _parse_pages(path, chunk, modalities, table_formats, fast_mode)
+                    for path, chunk in zip(task_paths, task_chunks, strict=True)
+                ]
+            )
+        else:
+            max_workers = min(num_workers, len(task_chunks))
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context(MP_START_METHOD),
+                initializer=_init_worker,
+            ) as executor:
+                results = iter(
+                    list(
+                        executor.map(
+                            _parse_pages,
+                            task_paths,
+                            task_chunks,
+                            repeat(modalities),
+                            repeat(table_formats),
+                            repeat(fast_mode),
+                            chunksize=max(1, len(task_chunks) // (max_workers * 4)),
+                        )
+                    )
+                )
+
+        want_text = "text" in modalities
         data = []
-        for result in self.load_documents(paths):
-            output = self.__export_result(result, modalities)
+        for task_count in task_counts:
+            text_parts: list[str] = []
+            tables: list[TableElement] = []
+            images: list[ImageElement] = []
+            add_text, add_tables, add_images = (
+                text_parts.append,
+                tables.extend,
+                images.extend,
+            )
+            for chunk in islice(results, task_count):
+                for page_text, page_tables, page_images in chunk:
+                    if want_text:
+                        add_text(page_text)
+                    add_tables(page_tables)
+                    add_images(page_images)
 
-            data.append(output)
+            text = TextElement(text=_join_pages(text_parts))
+            data.append(ParserOutput(text=text, tables=tables, images=images))
 
         return data
 
-    def __export_result(self, pages: list[Page], modalities: list[str]) -> ParserOutput:
+    def __export_result(
+        self,
+        pages: Iterable[Page],
+        modalities: Collection[str],
+        table_formats: list[str] | None = None,
+        decode_cache: OrderedDict[bytes, Image.Image] | None = None,
+        fast_mode: bool = False,
+    ) -> ParserOutput:
         """
         Export the result of the parsing process.
 
         Args:
-            pages (List[Page]): List of pages
-            modalities (List[str]): List of modalities to extract
+            pages (Iterable[Page]): The pages of the document
+            modalities (Collection[str]): Modalities to extract
+            table_formats (List[str], optional): Table representations to build
+            decode_cache (OrderedDict[bytes, Image.Image], optional): Images decoded earlier in the batch, by encoded bytes
+            fast_mode (bool, optional): Whether to skip table detection on pages without vector graphics
 
         Returns:
             output (ParserOutput): The ParserOutput object containing the extracted modalities.
         """
-        text = TextElement(text="")
+        want_text = "text" in modalities
+        extract_page = self._extract_page
+        image_cache: dict[int, tuple[Image.Image, dict]] = {}
+        text_parts: list[str] = []
         tables: list[TableElement] = []
         images: list[ImageElement] = []
+        # Bound methods are looked up once instead of on every page
+        add_text, add_tables, add_images = (
+            text_parts.append,
+            tables.extend,
+            images.extend,
+        )
 
         for page in pages:
-            if "text" in modalities:
-                text.text += self._extract_text(page).text + "\n"
+            page_text, page_tables, page_images = extract_page(
+                page, modalities, table_formats, image_cache, decode_cache, fast_mode
+            )
+            if want_text:
+                add_text(page_text)
+            add_tables(page_tables)
+            add_images(page_images)
 
-            if "tables" in modalities:
-                tables += self._extract_tables(page)
+        text = TextElement(text=_join_pages(text_parts))
+        return ParserOutput(text=text, tables=tables, images=images)
 
-            if "images" in modalities:
-                images += self._extract_images(page)
+    @staticmethod
+    def _extract_page(
+        page: Page,
+        modalities: Collection[str],
+        table_formats: list[str] | None = None,
+        image_cache: dict[int, tuple[Image.Image, dict]] | None = None,
+        decode_cache: OrderedDict[bytes, Image.Image] | None = None,
+        fast_mode: bool = False,
+    ) -> tuple[str, list[TableElement], list[ImageElement]]:
+        """
+        Extract the requested modalities from a single page.
 
-        return ParserOutput(text=text, tables=tables, images=images)
+        Args:
+            page (Page): The page to extract
+            modalities (Collection[str]): Modalities to extract
+            table_formats (List[str], optional): Table representations to build
+            image_cache (Dict[int, Tuple[Image.Image, Dict]], optional): Images already extracted from the document, by xref
+            decode_cache (OrderedDict[bytes, Image.Image], optional): Images decoded earlier in the batch, by encoded bytes
+            fast_mode (bool, optional): Whether to skip table detection on pages without vector graphics
+
+        Returns:
+            result (Tuple[str, List[TableElement], List[ImageElement]]): The text, tables and images of the page
+        """
+        text = PyMuPDFParser._extract_text(page).text if "text" in modalities else ""
+        tables = (
+            PyMuPDFParser._extract_tables(page, table_formats, fast_mode)
+            if "tables" in modalities
+            else []
+        )
+        images = (
+            PyMuPDFParser._extract_images(page, image_cache, decode_cache)
+            if "images" in modalities
+            else []
+        )
+        return text, tables, images
 
     @staticmethod
     def _extract_text(page: Page) -> TextElement:
@@ -170,15 +645,27 @@ class PyMuPDFParser:
             # Output: 'Hello, World!'
             ```
         """
-        return TextElement(text=page.get_text("text"))
+        return TextElement(text=page.get_text("text", flags=TEXT_FLAGS))
 
     @staticmethod
-    def _extract_images(page: Page) -> list[ImageElement]:
+    def _extract_images(
+        page: Page,
+        image_cache: dict[int, tuple[Image.Image, dict]] | None = None,
+        decode_cache: OrderedDict[bytes, Image.Image] | None = None,
+    ) -> list[ImageElement]:
         """
         Extract the images from the page.
 
+        Images referenced several times in a document (e.g. logos in page headers) are
+        only extracted and decoded once when the same image_cache is passed for all its
+        pages; their ImageElements then share the same PIL image. Likewise, images with
+        the same encoded bytes in other documents of a batch are decoded once when a
+        decode_cache is passed; it keeps the DECODE_CACHE_SIZE most recently used images.
+
         Args:
             page (Page): The page object
+            image_cache (Dict[int, Tuple[Image.Image, Dict]], optional): Images already extracted from the document, by xref
+            decode_cache (OrderedDict[bytes, Image.Image], optional): Images decoded earlier in the batch, by encoded bytes
 
         Returns:
             images (List[ImageElement]): List of ImageElement objects
@@ -197,25 +684,123 @@ class PyMuPDFParser:
             ```
         """
         images: list[ImageElement] = []
+        doc = page.parent
         for img in page.get_images(full=True):
             xref = img[0]
-            base_image = page.parent.extract_image(xref)
-            img_data = BytesIO(base_image["image"])
-            image = Image.open(img_data).convert("RGB")
+            cached = image_cache.get(xref) if image_cache is not None else None
+            if cached is not None:
+                image, base_image = cached
+            else:
+                base_image = doc.extract_image(xref)
+                data = base_image["image"]
+                decoded = decode_cache.get(data) if decode_cache is not None else None
+                if decoded is not None:
+                    decode_cache.move_to_end(data)
+                    image = decoded
+                else:
+                    # Image.open only reads the header; pixels are decoded on first access
+                    image = Image.open(BytesIO(data))
+                    # Converting copies the whole pixel buffer, so only do it when needed
+                    if image.mode != "RGB":
+                        # The converted image owns its pixels, so the source image and
+                        # its decoder state are released right away
+                        with image as source:
+                            image = PyMuPDFParser._convert_to_rgb(
+                                source, base_image, doc, xref
+                            )
+                    if decode_cache is not None:
+                        decode_cache[data] = image
+                        if len(decode_cache) > DECODE_CACHE_SIZE:
+                            decode_cache.popitem(last=False)
+                if image_cache is not None:
+                    image_cache[xref] = (image, base_image)
             images.append(
                 ImageElement(
-                    image=image, metadata=Metadata(page_number=page.number + 1)
+                    image=image,
+                    metadata=Metadata(page_number=page.number + 1),
+                    image_bytes=base_image["image"],
+                    image_format=base_image["ext"],
                 )
             )
         return images
 
     @staticmethod
-    def _extract_tables(page: Page) -> list[TableElement]:
+    def _convert_to_rgb(
+        image: Image.Image, base_image: dict, doc: fitz.Document, xref: int
+    ) -> Image.Image:
+        """
+        Decode an extracted image to RGB.
+
+        JPEG images are decoded with libjpeg-turbo through simplejpeg when it is
+        installed. Other images are rendered to RGB samples by PyMuPDF, which avoids
+        decoding the re-encoded image stream with Pillow and converting it afterwards.
+
+        Args:
+            image (Image.Image): The image opened with Pillow
+            base_image (Dict): The image as returned by Document.extract_image
+            doc (fitz.Document): The document containing the image
+            xref (int): The xref of the image in the document
+
+        Returns:
+            image (Image.Image): The RGB image
+        """
+        if simplejpeg is not None and base_image["ext"] in ("jpeg", "jpg"):
+            try:
+                return Image.fromarray(
+                    simplejpeg.decode_jpeg(base_image["image"], colorspace="RGB")
+                )
+            except ValueError as e:
+                logger.debug(
+                    "simplejpeg could not decode image, falling back to Pillow",
+                    extra={"error": str(e), "parser": "pymupdf"},
+                )
+        try:
+            return PyMuPDFParser._pixmap_to_rgb(doc, xref)
+        except (RuntimeError, ValueError) as e:
+            logger.debug(
+                "PyMuPDF could not render image, falling back to Pillow",
+                extra={"error": str(e), "parser": "pymupdf"},
+            )
+        return image.convert("RGB")
+
+    @staticmethod
+    def _pixmap_to_rgb(doc: fitz.Document, xref: int) -> Image.Image:
+        """
+        Render an image of the document to RGB with PyMuPDF.
+
+        Args:
+            doc (fitz.Document): The document containing the image
+            xref (int): The xref of the image in the document
+
+        Returns:
+            image (Image.Image): The RGB image
+        """
+        pix = fitz.Pixmap(doc, xref)
+        if pix.alpha:
+            pix = fitz.Pixmap(pix, 0)
+        size = (pix.width, pix.height)
+        # Read the samples through a memoryview; Pillow copies them into its own
+        # buffer, so no intermediate bytes object is allocated
+        if pix.n == 1:
+            # Gray images are expanded by Pillow in a single pass, instead of
+            # allocating an intermediate RGB pixmap
+            gray = Image.frombytes("L", size, pix.samples_mv, "raw", "L", pix.stride)
+            return gray.convert("RGB")
+        if pix.n != 3:
+            pix = fitz.Pixmap(fitz.csRGB, pix)
+        return Image.frombytes("RGB", size, pix.samples_mv)
+
+    @staticmethod
+    def _extract_tables(
+        page: Page, table_formats: list[str] | None = None, fast_mode: bool = False
+    ) -> list[TableElement]:
         """
         Extract the tables from the page.
 
         Args:
             page (Page): The page object
+            table_formats (List[str], optional): Table representations to build, among "markdown" and "dataframe". Defaults to both.
+            fast_mode (bool, optional): Whether to skip table detection when the page has no vector graphics. Defaults to False.
 
         Returns:
             tables (List[TableElement]): List of TableElement objects
@@ -234,14 +819,24 @@ class PyMuPDFParser:
                 bbox = table.metadata.bbox
             ```
         """
+        if table_formats is None:
+            table_formats = TABLE_FORMATS
+        want_markdown = "markdown" in table_formats
+        want_dataframe = "dataframe" in table_formats
+
+        # Tables are detected from ruling lines, and listing the drawings of a page
+        # costs a fraction of a table search
+        if fast_mode and not page.get_cdrawings():
+            return []
+
         tabs = page.find_tables()
 
         tables: list[TableElement] = []
         for tab in tabs:
             tables.append(
                 TableElement(
-                    markdown=tab.to_markdown(),
-                    dataframe=tab.to_pandas(),
+                    markdown=tab.to_markdown() if want_markdown else None,
+                    dataframe=tab.to_pandas() if want_dataframe else None,
                     metadata=Metadata(page_number=page.number + 1),
                 )
             )
@@ -49,8 +49,10 @@ class TableElement(BaseModel):
         metadata (Metadata): Metadata of the table.
     """
 
-    markdown: str = Field(None, description="The markdown representation of the table.")
-    dataframe: pd.DataFrame = Field(
+    markdown: str | None = Field(
+        None, description="The markdown representation of the table."
+    )
+    dataframe: pd.DataFrame | None = Field(
         None, description="The pandas DataFrame representation of the table."
     )
     metadata: Metadata = Field(..., description="Metadata of the table.")
@@ -84,12 +86,20 @@ class ImageElement(BaseModel):
     Image element.
 
     Attributes:
-        image (Image.Image): The image element.
+        image (Image.Image): The image element. Parsers may return a lazily decoded image, whose pixels are only read on first access.
         metadata (Metadata): Metadata of the image element.
+        image_bytes (bytes): The encoded image data as stored in the document, if available.
+        image_format (str): The format of the encoded image data (e.g. "png", "jpeg"), if available.
     """
 
     image: Image.Image = Field(..., description="The image element.")
     metadata: Metadata = Field(..., description="Metadata of the image element.")
+    image_bytes: bytes | None = Field(
+        None, description="The encoded image data as stored in the document."
+    )
+    image_format: str | None = Field(
+        None, description="The format of the encoded image data."
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -139,24 +149,3 @@ class ParserOutput(BaseModel):
     text: TextElement = Field(None, description="The text element.")
     tables: list[TableElement] = Field(None, description="List of table elements.")
     images: list[ImageElement] = Field(None, description="List of image elements.")
-
-    @field_validator("text")
-    @classmethod
-    def validate_text_element(cls, text_element):
-        if text_element is not None and not isinstance(text_element, TextElement):
-            raise ValueError("The 'text_element' key must be a TextElement object.")
-        return text_element
-
-    @field_validator("tables")
-    @classmethod
-    def validate_tables(cls, tables):
-        if tables is not None and not all(isinstance(i, TableElement) for i in tables):
-            raise ValueError("The 'tables' key must be a list of TableElement objects.")
-        return tables
-
-    @field_validator("images")
-    @classmethod
-    def validate_images(cls, images):
-        if images is not None and not all(isinstance(i, ImageElement) for i in images):
-            raise ValueError("The 'images' key must be a list of ImageElement objects.")
-        return images
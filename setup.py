@@ -13,7 +13,8 @@ setup(
     long_description_content_type="text/markdown",
     packages=find_packages(exclude=["tests"]),
     install_requires=[
-        "docling>=2.5.2,<3.0.0",
+        "docling>=2.48.0,<3.0.0",
+        "docling-core>=2.29.0,<3.0.0",
         "pymupdf>=1.24.13,<2.0.0",
         "llama-parse>=0.5.14,<0.6.0",
         "pytest>=8.3.3,<9.0.0",
@@ -78,3 +78,34 @@ class TestAnthropicPDFParser:
         assert isinstance(result[0], TableElement)
         assert result[0].markdown == table_data
         assert isinstance(result[0].dataframe, pd.DataFrame)
+
+    def test_extract_tables_markdown_only(self, parser):
+        table_data = "| Header |\n|--------|\n| Value |"
+        parsed_data = {"tables": [{"markdown": table_data, "page_number": 1}]}
+        result = parser._extract_tables(parsed_data, ["markdown"])
+        assert result[0].markdown == table_data
+        assert result[0].dataframe is None
+
+    def test_parse_invalid_table_format(self, parser):
+        with pytest.raises(ValueError, match="Invalid table format"):
+            parser.parse("test.pdf", ["tables"], table_formats=["html"])
+
+    def test_extract_tables_blank_header_with_rows(self, parser):
+        table_data = "|  |  |\n|---|---|\n| a | b |\n| c | d |"
+        parsed_data = {"tables": [{"markdown": table_data, "page_number": 1}]}
+        result = parser._extract_tables(parsed_data)
+        assert len(result) == 1
+        assert result[0].markdown == table_data
+        assert result[0].dataframe.values.tolist() == [["a", "b"], ["c", "d"]]
+
+    def test_extract_tables_header_only(self, parser):
+        parsed_data = {
+            "tables": [
+                {"markdown": "| A | B |\n|---|---|", "page_number": 1},
+                {"markdown": "||\n||", "page_number": 2},
+            ]
+        }
+        result = parser._extract_tables(parsed_data)
+        assert len(result) == 1
+        assert list(result[0].dataframe.columns) == ["A", "B"]
+        assert result[0].dataframe.empty
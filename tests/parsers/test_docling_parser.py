@@ -1,12 +1,26 @@
+import gc
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pandas as pd
 import pytest
 from docling.datamodel.base_models import ConversionStatus, InputFormat
 from docling.datamodel.document import ConversionResult, DoclingDocument
-from docling.datamodel.pipeline_options import PdfPipelineOptions
-from docling_core.types.doc import PictureItem, TableItem
+from docling.datamodel.pipeline_options import (
+    EasyOcrOptions,
+    PdfPipelineOptions,
+    RapidOcrOptions,
+    TableFormerMode,
+)
+from docling.datamodel.settings import settings
+from docling_core.types.doc import (
+    DocItemLabel,
+    PictureItem,
+    TableCell,
+    TableData,
+    TableItem,
+)
 from PIL import Image
 
 from parsestudio.parsers.docling_parser import (
@@ -22,7 +36,8 @@ from parsestudio.parsers.docling_parser import (
 class TestDoclingPDFParser:
     @pytest.fixture
     def parser(self):
-        return DoclingPDFParser()
+        with DoclingPDFParser() as parser:
+            yield parser
 
     def test_init(self, parser):
         pipeline_options = PdfPipelineOptions(do_ocr=False)
@@ -36,6 +51,107 @@ class TestDoclingPDFParser:
             is False
         )
 
+    def test_converter_cache(self):
+        DoclingPDFParser.clear_converter_cache()
+        first = DoclingPDFParser(pipeline_options=PdfPipelineOptions(do_ocr=False))
+        second = DoclingPDFParser(pipeline_options=PdfPipelineOptions(do_ocr=False))
+        other = DoclingPDFParser(pipeline_options=PdfPipelineOptions(do_ocr=True))
+        assert first.converter is second.converter
+        assert first.converter is not other.converter
+
+    def test_init_batch_size(self, monkeypatch):
+        monkeypatch.setattr(settings.perf, "page_batch_size", 4)
+        pipeline_options = PdfPipelineOptions(do_ocr=False)
+        parser = DoclingPDFParser(pipeline_options=pipeline_options, batch_size=16)
+
+        options = parser.converter.format_to_options[InputFormat.PDF].pipeline_options
+        assert settings.perf.page_batch_size == 4
+        assert options.do_ocr is False
+        if "layout_batch_size" in PdfPipelineOptions.model_fields:
+            assert options.layout_batch_size == 16
+            assert pipeline_options.layout_batch_size != 16
+
+    def test_load_documents_applies_batch_size(self, monkeypatch):
+        monkeypatch.setattr(settings.perf, "page_batch_size", 4)
+        parser = DoclingPDFParser(
+            pipeline_options=PdfPipelineOptions(do_ocr=False), batch_size=16
+        )
+        seen = []
+
+        def convert_all(paths, **kwargs):
+            for path in paths:
+                seen.append(settings.perf.page_batch_size)
+                yield path
+
+        with patch.object(parser, "converter") as mock_converter:
+            mock_converter.convert_all.side_effect = convert_all
+            for _ in parser.load_documents(["a.pdf", "b.pdf"]):
+                assert settings.perf.page_batch_size == 4
+
+        assert seen == [16, 16]
+        assert settings.perf.page_batch_size == 4
+
+    def test_init_invalid_batch_size(self):
+        with pytest.raises(ValueError, match="Invalid batch size"):
+            DoclingPDFParser(batch_size=0)
+
+    def test_init_fast_ocr_quality(self):
+        pipeline_options = PdfPipelineOptions(do_ocr=False)
+        parser = DoclingPDFParser(pipeline_options=pipeline_options, ocr_quality="fast")
+
+        options = parser.converter.format_to_options[InputFormat.PDF].pipeline_options
+        assert options.table_structure_options.mode == TableFormerMode.FAST
+        assert options.images_scale == 0.75
+        assert pipeline_options.table_structure_options.mode == TableFormerMode.ACCURATE
+
+    def test_init_invalid_ocr_quality(self):
+        with pytest.raises(ValueError, match="Invalid OCR quality"):
+            DoclingPDFParser(ocr_quality="medium")
+
+    def test_init_ocr_engine(self):
+        pipeline_options = PdfPipelineOptions(
+            do_ocr=False, ocr_options=EasyOcrOptions(force_full_page_ocr=True)
+        )
+        parser = DoclingPDFParser(
+            pipeline_options=pipeline_options, ocr_engine="openvino"
+        )
+
+        options = parser.converter.format_to_options[InputFormat.PDF].pipeline_options
+        assert isinstance(options.ocr_options, RapidOcrOptions)
+        assert options.ocr_options == RapidOcrOptions(
+            backend="openvino", force_full_page_ocr=True
+        )
+        assert isinstance(pipeline_options.ocr_options, EasyOcrOptions)
+
+    def test_init_invalid_ocr_engine(self):
+        with pytest.raises(ValueError, match="Invalid OCR engine"):
+            DoclingPDFParser(ocr_engine="tesseract")
+
+    def test_warmup_once_per_converter(self, parser):
+        DoclingPDFParser.clear_converter_cache()
+        mock_converter = Mock()
+        parser.converter = mock_converter
+
+        parser.warmup()
+        parser.warmup()
+
+        mock_converter.convert.assert_called_once()
+        stream = mock_converter.convert.call_args.args[0]
+        assert stream.name == "warmup.pdf"
+        assert stream.stream.getvalue().startswith(b"%PDF")
+        DoclingPDFParser.clear_converter_cache()
+
+    def test_warmup_failure_is_ignored(self, parser):
+        DoclingPDFParser.clear_converter_cache()
+        parser.converter = Mock()
+        parser.converter.convert.side_effect = RuntimeError("CUDA error")
+
+        parser.warmup()
+        parser.warmup()
+
+        assert parser.converter.convert.call_count == 2
+        DoclingPDFParser.clear_converter_cache()
+
     def test_load_documents(self, parser):
         parser.converter = Mock()
         parser.converter.convert_all.return_value = [Mock(spec=ConversionResult)]
@@ -91,7 +207,219 @@ class TestDoclingPDFParser:
         assert len(result) == 1
         assert isinstance(result[0], ParserOutput)
 
-    def test_extract_tables(self):
+    @patch("parsestudio.parsers.docling_parser.DoclingPDFParser.load_documents")
+    def test_iter_parse(self, mock_load_documents, parser):
+        mock_results = []
+        for _ in range(3):
+            mock_result = Mock(spec=ConversionResult)
+            mock_result.status = ConversionStatus.SUCCESS
+            mock_result.document = Mock(spec=DoclingDocument)
+            mock_results.append(mock_result)
+        mock_load_documents.return_value = mock_results
+
+        def fake_export(document, modalities, markdown_options, table_formats):
+            index = [result.document for result in mock_results].index(document)
+            return ParserOutput(text=TextElement(text=str(index)))
+
+        with patch.object(
+            parser, "_DoclingPDFParser__export_result", side_effect=fake_export
+        ):
+            outputs = parser.iter_parse(["a.pdf", "b.pdf", "c.pdf"], ["text"])
+            assert [output.text.text for output in outputs] == ["0", "1", "2"]
+
+    def test_from_pool(self):
+        with patch(
+            "parsestudio.parsers.docling_parser.ProcessPoolExecutor"
+        ) as mock_executor:
+            with DoclingPDFParser.from_pool(
+                3, pipeline_options=PdfPipelineOptions(do_ocr=False)
+            ) as parser:
+                mock_executor.assert_called_once()
+                assert mock_executor.call_args.kwargs["max_workers"] == 3
+                assert (
+                    mock_executor.call_args.kwargs["mp_context"].get_start_method()
+                    == "spawn"
+                )
+
+                with patch.object(
+                    parser, "_iter_parse_parallel", return_value=iter([])
+                ) as mock_parallel:
+                    parser.parse(["a.pdf", "b.pdf"], ["text"])
+                assert mock_parallel.call_args.args[3] == 3
+
+            mock_executor.return_value.shutdown.assert_called_once()
+
+        with pytest.raises(ValueError, match="Invalid number of workers"):
+            DoclingPDFParser.from_pool(0)
+
+    def test_pool_reused_until_closed(self, parser):
+        pool = parser._get_pool()
+        assert parser._get_pool() is pool
+
+        parser.close()
+        assert parser._pool is None
+        assert parser._get_pool() is not pool
+        parser.close()
+
+    def test_pools_shut_down_when_parser_is_collected(self):
+        with patch(
+            "parsestudio.parsers.docling_parser.ProcessPoolExecutor"
+        ) as mock_executor:
+            parser = DoclingPDFParser.from_pool(2)
+            pool = parser._get_pool()
+            del parser
+            gc.collect()
+
+        mock_executor.return_value.shutdown.assert_called_once()
+        with pytest.raises(RuntimeError):
+            pool.submit(print)
+
+    @patch("parsestudio.parsers.docling_parser.DoclingPDFParser.load_documents")
+    def test_iter_parse_failed_conversion(self, mock_load_documents, parser):
+        mock_result = Mock(spec=ConversionResult)
+        mock_result.status = ConversionStatus.FAILURE
+        mock_result.errors = ["broken"]
+        mock_load_documents.return_value = [mock_result]
+
+        with pytest.raises(ValueError, match="Failed to parse the document"):
+            list(parser.iter_parse("test.pdf"))
+
+    def test_parse_parallel_keeps_path_order(self, parser):
+        paths = ["a.pdf", "b.pdf", "c.pdf"]
+
+        def fake_parse_path(path, modalities, parse_options):
+            return ParserOutput(text=TextElement(text=path))
+
+        with (
+            patch(
+                "parsestudio.parsers.docling_parser.ProcessPoolExecutor",
+                side_effect=lambda max_workers, **kwargs: ThreadPoolExecutor(
+                    max_workers
+                ),
+            ) as mock_executor,
+            patch(
+                "parsestudio.parsers.docling_parser._parse_path",
+                side_effect=fake_parse_path,
+            ) as mock_parse_path,
+        ):
+            result = parser.parse(paths, ["text"], num_workers=2)
+            parser.parse(paths, ["text"], num_workers=2)
+            parser.close()
+
+        mock_executor.assert_called_once()
+        assert mock_executor.call_args.kwargs["initargs"] == (parser._parser_options,)
+        assert mock_parse_path.call_count == 6
+        assert [output.text.text for output in result] == paths
+
+    def test_export_result_tables_only(self, parser):
+        mock_document = Mock()
+        mock_document.tables = [Mock(spec=TableItem)]
+        mock_table = TableElement(
+            markdown="| Header |\n|--------|",
+            dataframe=pd.DataFrame(),
+            metadata=Metadata(),
+        )
+
+        with patch.object(
+            DoclingPDFParser, "_extract_table", return_value=mock_table
+        ) as mock_extract:
+            result = parser._DoclingPDFParser__export_result(
+                mock_document, ["tables"], {}
+            )
+
+        mock_extract.assert_called_once_with(mock_document.tables[0], None)
+        mock_document.iterate_items.assert_not_called()
+        assert result.tables == [mock_table]
+        assert result.images == []
+
+    def test_export_result_single_pass(self, parser):
+        table_item = Mock(spec=TableItem)
+        picture_items = [Mock(spec=PictureItem), Mock(spec=PictureItem)]
+        mock_document = Mock()
+        mock_document.iterate_items.return_value = [
+            (table_item, 0),
+            (picture_items[0], 0),
+            (Mock(), 0),
+            (picture_items[1], 0),
+        ]
+        mock_table = TableElement(markdown="| Header |", metadata=Metadata())
+        mock_image = ImageElement(image=Image.new("RGB", (1, 1)), metadata=Metadata())
+
+        with (
+            patch.object(
+                DoclingPDFParser, "_extract_table", return_value=mock_table
+            ) as mock_extract_table,
+            patch.object(
+                DoclingPDFParser, "_extract_image", side_effect=[mock_image, None]
+            ) as mock_extract_image,
+        ):
+            result = parser._DoclingPDFParser__export_result(
+                mock_document, ["tables", "images"], {}
+            )
+
+        mock_document.iterate_items.assert_called_once()
+        mock_extract_table.assert_called_once_with(table_item, None)
+        assert mock_extract_image.call_count == 2
+        assert result.tables == [mock_table]
+        assert result.images == [mock_image]
+
+    def test_export_result_with_text_single_pass(self, parser):
+        document = DoclingDocument(name="sample")
+        document.add_heading("Title")
+        document.add_text(label=DocItemLabel.TEXT, text="Some text")
+        table_data = TableData(num_rows=1, num_cols=1)
+        table_data.table_cells.append(
+            TableCell(
+                text="Cell",
+                start_row_offset_idx=0,
+                end_row_offset_idx=1,
+                start_col_offset_idx=0,
+                end_col_offset_idx=1,
+            )
+        )
+        table_item = document.add_table(data=table_data)
+        picture_item = document.add_picture()
+        mock_table = TableElement(markdown="| Cell |", metadata=Metadata())
+        mock_image = ImageElement(image=Image.new("RGB", (1, 1)), metadata=Metadata())
+
+        with (
+            patch.object(
+                DoclingPDFParser, "_extract_table", return_value=mock_table
+            ) as mock_extract_table,
+            patch.object(
+                DoclingPDFParser, "_extract_image", return_value=mock_image
+            ) as mock_extract_image,
+            patch.object(
+                DoclingDocument, "export_to_markdown"
+            ) as mock_export_to_markdown,
+        ):
+            result = parser._DoclingPDFParser__export_result(
+                document, ["text", "tables", "images"], {"image_placeholder": "<img>"}
+            )
+
+        mock_export_to_markdown.assert_not_called()
+        assert result.text.text == document.export_to_markdown(
+            image_placeholder="<img>"
+        )
+        mock_extract_table.assert_called_once_with(table_item, None)
+        mock_extract_image.assert_called_once_with(picture_item, document)
+        assert result.tables == [mock_table]
+        assert result.images == [mock_image]
+
+    def test_export_result_with_unsupported_markdown_options(self, parser):
+        mock_document = Mock()
+        mock_document.export_to_markdown.return_value = "Sample text"
+        mock_document.iterate_items.return_value = []
+
+        result = parser._DoclingPDFParser__export_result(
+            mock_document, ["text", "tables", "images"], {"page_no": 1}
+        )
+
+        mock_document.export_to_markdown.assert_called_once_with(page_no=1)
+        mock_document.iterate_items.assert_called_once()
+        assert result.text.text == "Sample text"
+
+    def test_extract_table(self):
         mock_table_item = Mock(spec=TableItem)
         mock_table_item.export_to_markdown.return_value = "| Header |\n|--------|"
         mock_table_item.export_to_dataframe.return_value = pd.DataFrame(
@@ -99,37 +427,48 @@ class TestDoclingPDFParser:
         )
         mock_table_item.prov = [Mock(page_no=1, bbox=Mock(l=0, t=0, r=1, b=1))]
 
-        result = DoclingPDFParser._extract_tables(mock_table_item)
+        result = DoclingPDFParser._extract_table(mock_table_item)
 
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], TableElement)
+        assert isinstance(result, TableElement)
 
-        assert result[0].markdown == "| Header |\n|--------|"
-        assert result[0].dataframe.shape == (2, 2)
-        assert result[0].metadata.page_number == 1
-        assert result[0].metadata.bbox == [0.0, 0.0, 1.0, 1.0]
+        assert result.markdown == "| Header |\n|--------|"
+        assert result.dataframe.shape == (2, 2)
+        assert result.metadata.page_number == 1
+        assert result.metadata.bbox == [0.0, 0.0, 1.0, 1.0]
 
-    def test_extract_images(self):
+    def test_extract_table_markdown_only(self):
+        mock_table_item = Mock(spec=TableItem)
+        mock_table_item.export_to_markdown.return_value = "| Header |\n|--------|"
+        mock_table_item.prov = [Mock(page_no=1, bbox=Mock(l=0, t=0, r=1, b=1))]
+
+        result = DoclingPDFParser._extract_table(mock_table_item, ["markdown"])
+
+        assert result.markdown == "| Header |\n|--------|"
+        assert result.dataframe is None
+        mock_table_item.export_to_dataframe.assert_not_called()
+
+    def test_parse_invalid_table_format(self, parser):
+        with pytest.raises(ValueError, match="Invalid table format"):
+            parser.parse("test.pdf", table_formats=["csv"])
+
+    def test_extract_image(self):
         mock_picture_item = Mock(spec=PictureItem)
         mock_image = Image.new("RGB", (60, 30), color="red")
         mock_picture_item.get_image.return_value = mock_image
         mock_picture_item.prov = [Mock(page_no=1, bbox=Mock(l=0, t=0, r=1, b=1))]
 
-        result = DoclingPDFParser._extract_images(
+        result = DoclingPDFParser._extract_image(
             mock_picture_item, Mock(spec=DoclingDocument)
         )
 
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], ImageElement)
+        assert isinstance(result, ImageElement)
 
-        assert result[0].image.size == (60, 30)
-        assert isinstance(result[0].metadata, Metadata)
-        assert result[0].metadata.page_number == 1
-        assert result[0].metadata.bbox == [0.0, 0.0, 1.0, 1.0]
+        assert result.image.size == (60, 30)
+        assert isinstance(result.metadata, Metadata)
+        assert result.metadata.page_number == 1
+        assert result.metadata.bbox == [0.0, 0.0, 1.0, 1.0]
 
-    def test_extract_images_no_image(self, parser):
+    def test_extract_image_no_image(self, parser):
         # Create a mock PictureItem
         mock_picture_item = Mock(spec=PictureItem)
 
@@ -137,12 +476,12 @@ class TestDoclingPDFParser:
         mock_picture_item.get_image.return_value = None
 
         # Call the method to test
-        result = DoclingPDFParser._extract_images(
+        result = DoclingPDFParser._extract_image(
             mock_picture_item, Mock(spec=DoclingDocument)
         )
 
-        # Assert the result is an empty list
-        assert result == []
+        # Assert no image element is returned
+        assert result is None
 
     def test_extract_text(self, parser):
         mock_document = Mock(spec=DoclingDocument)
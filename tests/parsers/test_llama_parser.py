@@ -1,4 +1,9 @@
+import copy
+import gc
+import io
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch
 
 import pandas as pd
@@ -6,6 +11,7 @@ import pytest
 from PIL import Image
 
 from parsestudio.parsers.llama_parser import (
+    PYARROW_MIN_CSV_SIZE,
     ImageElement,
     LlamaPDFParser,
     Metadata,
@@ -15,13 +21,40 @@ from parsestudio.parsers.llama_parser import (
 )
 
 
+@pytest.fixture
+def image_server():
+    """Serve the same PNG image at every path, like the LlamaParse image route."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (3, 2)).save(buffer, format="PNG")
+    png = buffer.getvalue()
+
+    class ImageHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(png)))
+            self.end_headers()
+            self.wfile.write(png)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ImageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
 class TestLlamaPDFParser:
     @pytest.fixture
     def parser(self):
         with patch.dict("os.environ", {"LLAMA_PARSE_KEY": "mock_api_key"}):
             parser = LlamaPDFParser()
-            assert parser.converter.api_key == "mock_api_key"
-            return parser
+        assert parser.converter.api_key == "mock_api_key"
+        with parser:
+            yield parser
 
     @patch.dict(os.environ, {"LLAMA_PARSE_KEY": "mock_api_key"})
     def test_init(self, parser):
@@ -41,15 +74,51 @@ class TestLlamaPDFParser:
         assert parser.converter.api_key == "mock_api_key"
         assert parser.converter.show_progress == llama_options["show_progress"]
 
-    def test_load_documents(self, parser):
+    @patch.dict(os.environ, {"LLAMA_PARSE_KEY": "mock_api_key"})
+    def test_converter_not_shared(self, parser):
+        """
+        Test that parsers with the same options do not share their converter and its HTTP client.
+        """
+        other = LlamaPDFParser()
+
+        assert other.converter is not parser.converter
+        assert other.converter.aclient is not parser.converter.aclient
+
+    def test_load_documents(self, parser, tmp_path):
         """
         Test the load_documents method when the parser is initialized and the file exists.
         """
+        path = tmp_path / "test.pdf"
+        path.write_bytes(b"%PDF-1.4")
         parser.converter = Mock()
         parser.converter.get_json_result.return_value = [{"test": "data"}]
-        result = list(parser.load_documents(["test.pdf"]))
+        result = list(parser.load_documents([str(path)]))
         assert result == [{"test": "data"}]
 
+    def test_load_documents_missing_files(self, parser, tmp_path):
+        """
+        Test that all missing files are reported before anything is uploaded.
+        """
+        for name in ("a.pdf", "b.pdf"):
+            (tmp_path / name).write_bytes(b"%PDF-1.4")
+        (tmp_path / "folder.pdf").mkdir()
+        paths = [
+            str(tmp_path / "a.pdf"),
+            str(tmp_path / "b.pdf"),
+            str(tmp_path / "missing.pdf"),
+            str(tmp_path / "folder.pdf"),
+            "other/missing.pdf",
+        ]
+        parser.converter = Mock()
+
+        with pytest.raises(ValueError, match="Invalid paths") as excinfo:
+            list(parser.load_documents(paths))
+
+        for path in paths[2:]:
+            assert path in str(excinfo.value)
+        assert paths[0] not in str(excinfo.value)
+        parser.converter.get_json_result.assert_not_called()
+
     @patch.dict(os.environ, {"LLAMA_PARSE_KEY": "mock_api_key"})
     @patch.object(LlamaPDFParser, "load_documents")
     @patch.object(LlamaPDFParser, "_LlamaPDFParser__export_result")
@@ -93,7 +162,9 @@ class TestLlamaPDFParser:
 
         result = parser.parse("test.pdf", ["text", "tables", "images"])
         mock_load.assert_called_once_with(["test.pdf"])
-        mock_export.assert_called_once_with(mock_document, ["text", "tables", "images"])
+        mock_export.assert_called_once_with(
+            mock_document, ["text", "tables", "images"], ["markdown", "dataframe"]
+        )
 
         assert isinstance(result, list)
         assert len(result) == 1
@@ -132,19 +203,183 @@ class TestLlamaPDFParser:
         assert isinstance(result[0].metadata, Metadata)
         assert result[0].metadata.page_number == 1
 
-    @patch("parsestudio.parsers.llama_parser.Image.open")
-    @patch("os.remove")
-    def test_extract_images(self, mock_remove, mock_image_open, parser):
+    def test_pool_reused_until_closed(self, parser):
+        pool = parser._get_pool()
+        assert parser._get_pool() is pool
+
+        parser.close()
+        assert parser._pool is None
+        assert parser._get_pool() is not pool
+        parser.close()
+
+    @patch.dict(os.environ, {"LLAMA_PARSE_KEY": "mock_api_key"})
+    def test_pool_shut_down_when_parser_is_collected(self):
+        parser = LlamaPDFParser()
+        pool = parser._get_pool()
+        del parser
+        gc.collect()
+
+        with pytest.raises(RuntimeError):
+            pool.submit(print)
+
+    def test_export_result_text(self, parser):
+        pages = [{"page": 1, "text": "first"}, {"page": 2, "text": "second"}]
+        result = parser._LlamaPDFParser__export_result(
+            {"job_id": "job123", "pages": pages}, ["text"]
+        )
+        assert result.text.text == "first\nsecond\n"
+
+    def test_export_result_downloads_images_in_page_order(self, parser):
+        pages = [{"page": number, "text": "", "items": []} for number in (1, 2, 3)]
+
+        def fake_extract_images(pages, job_id):
+            return [
+                ImageElement(
+                    image=Image.new("RGB", (1, 1)),
+                    metadata=Metadata(page_number=page["page"]),
+                )
+                for page in pages
+            ]
+
+        with patch.object(
+            parser, "_extract_images", side_effect=fake_extract_images
+        ) as mock_extract_images:
+            result = parser._LlamaPDFParser__export_result(
+                {"job_id": "job123", "pages": pages}, ["images"]
+            )
+
+        mock_extract_images.assert_called_once_with(pages, "job123")
+        assert [image.metadata.page_number for image in result.images] == [1, 2, 3]
+
+    def test_extract_images_downloads_from_llama_parse(self, image_server):
+        options = {"base_url": image_server, "ignore_errors": False}
+        with patch.dict("os.environ", {"LLAMA_PARSE_KEY": "mock_api_key"}):
+            parser = LlamaPDFParser(llama_options=options)
+        pages = [
+            {"page": number, "images": [{"name": f"p{number}_{i}.png"} for i in (1, 2)]}
+            for number in range(1, 41)
+        ]
+
+        with parser:
+            for _ in range(2):
+                result = parser._extract_images(copy.deepcopy(pages), "job123")
+                page_numbers = [image.metadata.page_number for image in result]
+                assert page_numbers == [
+                    number for number in range(1, 41) for _ in (1, 2)
+                ]
+                assert all(image.image.size == (3, 2) for image in result)
+
+    def test_extract_tables_markdown_only(self, parser):
+        page = {
+            "items": [{"type": "table", "md": "| Header |", "csv": "Header\nValue"}],
+            "page": 1,
+        }
+        with patch("parsestudio.parsers.llama_parser.pd.read_csv") as mock_read_csv:
+            result = parser._extract_tables(page, ["markdown"])
+
+        assert result[0].markdown == "| Header |"
+        assert result[0].dataframe is None
+        mock_read_csv.assert_not_called()
+
+    def test_parse_invalid_table_format(self, parser):
+        with pytest.raises(ValueError, match="Invalid table format"):
+            parser.parse("test.pdf", table_formats=["csv"])
+
+    def test_extract_tables_empty_csv(self, parser):
+        page = {
+            "items": [{"type": "table", "md": "| Header |", "csv": ""}],
+            "page": 1,
+        }
+        result = parser._extract_tables(page)
+
+        assert len(result) == 1
+        assert result[0].markdown == "| Header |"
+        assert result[0].dataframe is None
+
+    def test_extract_tables_large_csv_engine(self, parser):
+        page = {
+            "items": [{"type": "table", "md": "| Header |", "csv": "Header\nValue"}],
+            "page": 1,
+        }
+        with (
+            patch("parsestudio.parsers.llama_parser.PYARROW_AVAILABLE", True),
+            patch("parsestudio.parsers.llama_parser.PYARROW_MIN_CSV_SIZE", 1),
+            patch("parsestudio.parsers.llama_parser.pd.read_csv") as mock_read_csv,
+        ):
+            mock_read_csv.return_value = pd.DataFrame({"Header": ["Value"]})
+            parser._extract_tables(page)
+
+        assert mock_read_csv.call_args.kwargs["engine"] == "pyarrow"
+
+    def test_read_csv_table_same_dtypes_for_any_size(self, parser):
+        rows = '1,2.5,2020-01-01,\nNA,"x, y",,3\n'
+        small_csv = "a,b,c,d\n" + rows
+        repeat = PYARROW_MIN_CSV_SIZE // len(rows) + 1
+        large_csv = "a,b,c,d\n" + rows * repeat
+        assert len(small_csv) < PYARROW_MIN_CSV_SIZE <= len(large_csv)
+
+        small = parser._read_csv_table(small_csv)
+        large = parser._read_csv_table(large_csv)
+
+        assert len(large) == 2 * repeat
+        pd.testing.assert_frame_equal(large.head(2), small)
+        assert small.iloc[0].tolist()[:3] == ["1", "2.5", "2020-01-01"]
+        assert pd.isna(small.iloc[0, 3])
+        assert small.iloc[1, 0] == "NA"
+
+    def test_extract_images(self, parser):
         """
-        Test the _extract_images method by patching the Image.open and os.remove functions.
+        Test the _extract_images method with images downloaded to a temporary directory.
         """
         page = {"dummy": "data", "page": 1}
         job_id = "job123"
+        download_paths = []
+
+        def fake_get_images(json_result, download_path):
+            download_paths.append(download_path)
+            image_path = os.path.join(download_path, "test_image.png")
+            Image.new("L", (60, 30)).save(image_path)
+            return [{"path": image_path, "page_number": 1}]
 
         parser.converter = Mock()
-        parser.converter.get_images.return_value = [{"path": "test_image.jpg"}]
-        mock_image_open.return_value.convert.return_value = Image.new("RGB", (60, 30))
-        result = parser._extract_images(page, job_id)
+        parser.converter.get_images.side_effect = fake_get_images
+        result = parser._extract_images([page], job_id)
         assert len(result) == 1
         assert isinstance(result[0], ImageElement)
-        mock_remove.assert_called_once_with("test_image.jpg")
+        assert result[0].image.mode == "RGB"
+        assert result[0].image.size == (60, 30)
+        assert not os.path.exists(download_paths[0])
+
+    def test_open_image_keeps_rgb_image(self, tmp_path):
+        image_path = str(tmp_path / "image.png")
+        Image.new("RGB", (4, 2), (1, 2, 3)).save(image_path)
+
+        with patch.object(Image.Image, "convert") as mock_convert:
+            image = LlamaPDFParser._open_image(image_path)
+        os.remove(image_path)
+
+        mock_convert.assert_not_called()
+        assert image.mode == "RGB"
+        assert image.getpixel((0, 0)) == (1, 2, 3)
+
+    def test_extract_images_decodes_in_order(self, parser):
+        page = {"page": 2}
+        sizes = [(10, 10), (20, 10), (30, 10)]
+
+        def fake_get_images(json_result, download_path):
+            image_dicts = []
+            for index, size in enumerate(sizes):
+                image_path = os.path.join(download_path, f"image_{index}.png")
+                Image.new("RGBA", size).save(image_path)
+                image_dicts.append({"path": image_path, "page_number": 2})
+            return image_dicts
+
+        parser.converter = Mock()
+        parser.converter.get_images.side_effect = fake_get_images
+        result = parser._extract_images([page], "job123")
+        parser.close()
+
+        assert [image.image.size for image in result] == sizes
+        assert all(image.image.mode == "RGB" for image in result)
+        assert all(image.metadata.page_number == 2 for image in result)
+        assert parser._pool is None
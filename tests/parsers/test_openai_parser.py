@@ -1,13 +1,27 @@
-from unittest.mock import mock_open, patch
+import json
+import threading
+from unittest.mock import MagicMock, mock_open, patch
 
 import pandas as pd
 import pytest
 
-from parsestudio.parsers.openai_file_search_parser import OpenAIAssistantPDFParser
+from parsestudio.parsers.openai_file_search_parser import (
+    DIRECT_INPUT_MAX_BYTES,
+    OpenAIAssistantPDFParser,
+)
 from parsestudio.parsers.openai_parser import OpenAIPDFParser
 from parsestudio.parsers.schemas import ParserOutput, TableElement, TextElement
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    OpenAIAssistantPDFParser.clear_client_cache()
+    OpenAIAssistantPDFParser.clear_document_cache()
+    yield
+    OpenAIAssistantPDFParser.clear_client_cache()
+    OpenAIAssistantPDFParser.clear_document_cache()
+
+
 class TestOpenAIPDFParser:
     @pytest.fixture
     def parser(self):
@@ -161,6 +175,22 @@ class TestOpenAIAssistantPDFParser:
         assert result[0].metadata.page_number == 1
         assert result[1].metadata.page_number == 2
 
+    def test_extract_tables_blank_header_with_rows(self, mock_parser):
+        table_data = "|  |  |\n|---|---|\n| a | b |\n| c | d |"
+        parsed_data = {"tables": [{"markdown": table_data, "page_number": 1}]}
+        result = mock_parser._extract_tables(parsed_data)
+        assert len(result) == 1
+        assert result[0].markdown == table_data
+        assert result[0].dataframe.values.tolist() == [["a", "b"], ["c", "d"]]
+
+    def test_extract_tables_skips_empty_rows(self, mock_parser):
+        table_data = "| A | B |\n|---|---|\n| 1 | 2 |\n|   |   |\n| 3 | 4 |"
+        parsed_data = {"tables": [{"markdown": table_data, "page_number": 1}]}
+        result = mock_parser._extract_tables(parsed_data)
+        assert len(result) == 1
+        assert list(result[0].dataframe.columns) == ["A", "B"]
+        assert result[0].dataframe.values.tolist() == [["1", "2"], ["3", "4"]]
+
     @patch("builtins.open", mock_open(read_data=b"test"))
     def test_parse_single_file(self, mock_parser):
         with patch.object(mock_parser, "load_documents") as mock_load:
@@ -183,12 +213,26 @@ class TestOpenAIAssistantPDFParser:
 
     def test_export_result_text_only(self, mock_parser):
         parsed = {"text_content": "Sample text", "tables": []}
-        result = mock_parser._OpenAIAssistantPDFParser__export_result(parsed, ["text"])
+        with patch.object(mock_parser, "_extract_tables") as mock_extract_tables:
+            result = mock_parser._OpenAIAssistantPDFParser__export_result(
+                parsed, ["text"]
+            )
+        mock_extract_tables.assert_not_called()
         assert isinstance(result, ParserOutput)
         assert result.text.text == "Sample text"
         assert len(result.tables) == 0
         assert len(result.images) == 0
 
+    def test_extract_tables_dataframe_only(self, mock_parser):
+        parsed = {"tables": [{"markdown": "| A |\n|---|\n| 1 |", "page_number": 1}]}
+        result = mock_parser._extract_tables(parsed, ["dataframe"])
+        assert result[0].markdown is None
+        assert result[0].dataframe["A"].tolist() == ["1"]
+
+    def test_parse_invalid_table_format(self, mock_parser):
+        with pytest.raises(ValueError, match="Invalid table formats"):
+            mock_parser.parse("test.pdf", ["tables"], table_formats=["html"])
+
     def test_export_result_with_tables(self, mock_parser):
         table_data = "| Header |\n|--------|\n| Value |"
         parsed = {
@@ -205,7 +249,7 @@ class TestOpenAIAssistantPDFParser:
         assert len(result.tables) == 1
         assert len(result.images) == 0
 
-    @patch.object(OpenAIAssistantPDFParser, "_get_or_create_vector_store")
+    @patch.object(OpenAIAssistantPDFParser, "_create_vector_store")
     @patch.object(OpenAIAssistantPDFParser, "_upload_file_to_vector_store")
     @patch.object(OpenAIAssistantPDFParser, "_analyze_with_assistant_api")
     @patch.object(OpenAIAssistantPDFParser, "_cleanup_resources")
@@ -222,5 +266,281 @@ class TestOpenAIAssistantPDFParser:
         assert result[0]["text_content"] == "Test content"
         mock_vector_store.assert_called_once()
         mock_upload.assert_called_once_with("test.pdf", "vector_store_id")
-        mock_analyze.assert_called_once_with("file_id")
+        mock_analyze.assert_called_once_with("vector_store_id", include_tables=True)
         mock_cleanup.assert_called_once()
+
+    def test_analyze_with_assistant_api_backs_off_polling(self, mock_parser):
+        client = mock_parser.client
+        client.beta.threads.runs.retrieve.side_effect = [
+            MagicMock(status="queued"),
+            MagicMock(status="in_progress"),
+            MagicMock(status="in_progress"),
+            MagicMock(status="completed"),
+        ]
+        message = MagicMock()
+        message.content[0].text.value = "Extracted text"
+        client.beta.threads.messages.list.return_value.data = [message]
+
+        with patch(
+            "parsestudio.parsers.openai_file_search_parser.time.sleep"
+        ) as mock_sleep:
+            result = mock_parser._analyze_with_assistant_api("vector_store_id")
+
+        assert result == {"text_content": "Extracted text", "tables": []}
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [
+            0.25,
+            0.5,
+            1.0,
+        ]
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "mock_api_key"})
+    def test_init_reuses_client_and_assistant(self):
+        with patch(
+            "parsestudio.parsers.openai_file_search_parser.OpenAI"
+        ) as mock_openai:
+            mock_openai.return_value.beta.assistants.create.return_value.id = "asst_1"
+            first = OpenAIAssistantPDFParser()
+            second = OpenAIAssistantPDFParser()
+            OpenAIAssistantPDFParser({"model": "gpt-4o-mini"})
+
+        mock_openai.assert_called_once()
+        assert second.client is first.client
+        assert second.assistant_id == first.assistant_id == "asst_1"
+        # A different model needs its own assistant
+        assert mock_openai.return_value.beta.assistants.create.call_count == 2
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "mock_api_key"})
+    def test_init_uses_http2_when_available(self):
+        with (
+            patch(
+                "parsestudio.parsers.openai_file_search_parser.HTTP2_AVAILABLE", True
+            ),
+            patch(
+                "parsestudio.parsers.openai_file_search_parser.DefaultHttpxClient"
+            ) as mock_http_client,
+            patch(
+                "parsestudio.parsers.openai_file_search_parser.OpenAI"
+            ) as mock_openai,
+        ):
+            OpenAIAssistantPDFParser()
+
+        mock_http_client.assert_called_once_with(http2=True)
+        assert (
+            mock_openai.call_args.kwargs["http_client"] is mock_http_client.return_value
+        )
+
+    def test_analyze_with_assistant_api_searches_vector_store(self, mock_parser):
+        client = mock_parser.client
+        client.beta.threads.runs.retrieve.return_value = MagicMock(status="completed")
+        client.beta.threads.messages.list.return_value.data = []
+
+        mock_parser._analyze_with_assistant_api("vector_store_id")
+
+        kwargs = client.beta.threads.create.call_args.kwargs
+        assert kwargs["tool_resources"] == {
+            "file_search": {"vector_store_ids": ["vector_store_id"]}
+        }
+        assert "attachments" not in kwargs["messages"][0]
+
+    def test_analyze_with_assistant_api_parses_json_message(self, mock_parser):
+        client = mock_parser.client
+        client.beta.threads.runs.retrieve.return_value = MagicMock(status="completed")
+        message = MagicMock()
+        message.content[0].text.value = json.dumps(
+            {"text_content": "Text", "tables": [{"markdown": "| A |"}]}
+        )
+        client.beta.threads.messages.list.return_value.data = [message]
+
+        result = mock_parser._analyze_with_assistant_api("vector_store_id")
+
+        assert result == {"text_content": "Text", "tables": [{"markdown": "| A |"}]}
+
+    def test_iter_parse_is_lazy(self, mock_parser):
+        produced = []
+
+        def fake_load_documents(paths, modalities):
+            for path in paths:
+                produced.append(path)
+                yield {"text_content": path, "tables": []}
+
+        with patch.object(
+            mock_parser, "load_documents", side_effect=fake_load_documents
+        ):
+            outputs = mock_parser.iter_parse(["a.pdf", "b.pdf", "c.pdf"], ["text"])
+            assert next(outputs).text.text == "a.pdf"
+            assert produced == ["a.pdf"]
+            assert [output.text.text for output in outputs] == ["b.pdf", "c.pdf"]
+
+    def test_iter_parse_validates_eagerly(self, mock_parser):
+        with pytest.raises(ValueError, match="Invalid modalities"):
+            mock_parser.iter_parse("a.pdf", ["invalid"])
+
+    def test_load_documents_bounds_pending_results(self, mock_parser):
+        mock_parser.max_concurrency = 2
+        started = []
+
+        def fake_process(path, text_only=False):
+            started.append(path)
+            return {"text_content": path, "tables": []}
+
+        paths = [f"{i}.pdf" for i in range(5)]
+        with patch.object(mock_parser, "_process_document", side_effect=fake_process):
+            documents = mock_parser.load_documents(paths)
+            assert next(documents)["text_content"] == "0.pdf"
+            assert len(started) <= 2
+            assert [doc["text_content"] for doc in documents] == paths[1:]
+
+    def test_init_invalid_max_concurrency(self):
+        with (
+            patch.dict("os.environ", {"OPENAI_API_KEY": "mock_api_key"}),
+            pytest.raises(ValueError, match="Invalid max concurrency"),
+        ):
+            OpenAIAssistantPDFParser(max_concurrency=0)
+
+    def test_load_documents_concurrent_keeps_order(self, mock_parser):
+        paths = ["a.pdf", "b.pdf", "c.pdf"]
+        release = threading.Barrier(len(paths), timeout=5)
+
+        def fake_process(path, text_only=False):
+            # All documents must be in flight at once to pass the barrier
+            release.wait()
+            return {"text_content": path, "tables": []}
+
+        with patch.object(
+            mock_parser, "_process_document", side_effect=fake_process
+        ) as mock_process:
+            result = list(mock_parser.load_documents(paths))
+
+        assert [doc["text_content"] for doc in result] == paths
+        assert mock_process.call_count == len(paths)
+
+    @patch.object(OpenAIAssistantPDFParser, "_create_vector_store")
+    @patch.object(OpenAIAssistantPDFParser, "_upload_file_to_vector_store")
+    @patch.object(OpenAIAssistantPDFParser, "_analyze_with_assistant_api")
+    @patch.object(OpenAIAssistantPDFParser, "_cleanup_resources")
+    def test_load_documents_cache_hit_skips_upload(
+        self,
+        mock_cleanup,
+        mock_analyze,
+        mock_upload,
+        mock_vector_store,
+        mock_parser,
+        tmp_path,
+    ):
+        first = tmp_path / "a.pdf"
+        copy = tmp_path / "copy.pdf"
+        first.write_bytes(b"%PDF-1.4 same")
+        copy.write_bytes(b"%PDF-1.4 same")
+        mock_upload.return_value = "file_id"
+        mock_analyze.return_value = {"text_content": "Test content", "tables": []}
+
+        list(mock_parser.load_documents([str(first)]))
+        # A text-only request is served by the earlier full analysis
+        result = list(mock_parser.load_documents([str(copy)], ["text"]))
+
+        assert result == [{"text_content": "Test content", "tables": []}]
+        mock_upload.assert_called_once()
+        mock_analyze.assert_called_once()
+
+    @patch.object(OpenAIAssistantPDFParser, "_create_vector_store")
+    @patch.object(OpenAIAssistantPDFParser, "_upload_file_to_vector_store")
+    @patch.object(OpenAIAssistantPDFParser, "_analyze_with_assistant_api")
+    @patch.object(OpenAIAssistantPDFParser, "_cleanup_resources")
+    def test_load_documents_cache_keyed_by_options(
+        self,
+        mock_cleanup,
+        mock_analyze,
+        mock_upload,
+        mock_vector_store,
+        mock_parser,
+        tmp_path,
+    ):
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        mock_upload.return_value = "file_id"
+        mock_analyze.return_value = {"text_content": "Test content", "tables": []}
+
+        list(mock_parser.load_documents([str(path)]))
+        # Another temperature can produce another analysis
+        mock_parser.options = {**mock_parser.options, "temperature": 0.5}
+        list(mock_parser.load_documents([str(path)]))
+        assert mock_analyze.call_count == 2
+
+        list(mock_parser.load_documents([str(path)]))
+        assert mock_analyze.call_count == 2
+
+    @patch("os.path.getsize", return_value=DIRECT_INPUT_MAX_BYTES)
+    @patch.object(OpenAIAssistantPDFParser, "_create_vector_store")
+    @patch.object(OpenAIAssistantPDFParser, "_upload_file_to_vector_store")
+    @patch.object(OpenAIAssistantPDFParser, "_analyze_with_assistant_api")
+    @patch.object(OpenAIAssistantPDFParser, "_cleanup_resources")
+    def test_load_documents_large_text_only_skips_tables(
+        self,
+        mock_cleanup,
+        mock_analyze,
+        mock_upload,
+        mock_vector_store,
+        mock_getsize,
+        mock_parser,
+        tmp_path,
+    ):
+        path = tmp_path / "large.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        mock_vector_store.return_value = "vector_store_id"
+        mock_upload.return_value = "file_id"
+        mock_analyze.return_value = {"text_content": "Test content", "tables": []}
+
+        list(mock_parser.load_documents([str(path)], ["text"]))
+        mock_analyze.assert_called_once_with("vector_store_id", include_tables=False)
+
+        # A text-only analysis cannot serve a request for tables
+        list(mock_parser.load_documents([str(path)]))
+        assert mock_analyze.call_count == 2
+        mock_analyze.assert_called_with("vector_store_id", include_tables=True)
+
+    @patch.object(OpenAIAssistantPDFParser, "_create_vector_store")
+    @patch.object(OpenAIAssistantPDFParser, "_upload_file_to_vector_store")
+    @patch.object(OpenAIAssistantPDFParser, "_analyze_with_assistant_api")
+    @patch.object(OpenAIAssistantPDFParser, "_cleanup_resources")
+    def test_load_documents_does_not_cache_failures(
+        self,
+        mock_cleanup,
+        mock_analyze,
+        mock_upload,
+        mock_vector_store,
+        mock_parser,
+        tmp_path,
+    ):
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        mock_analyze.return_value = {"text_content": "", "tables": []}
+
+        list(mock_parser.load_documents([str(path)]))
+        list(mock_parser.load_documents([str(path)]))
+
+        assert mock_analyze.call_count == 2
+
+    @patch("os.path.getsize", return_value=1024)
+    @patch.object(OpenAIAssistantPDFParser, "_create_vector_store")
+    @patch.object(OpenAIAssistantPDFParser, "_upload_file")
+    @patch.object(OpenAIAssistantPDFParser, "_analyze_with_chat_completions")
+    @patch.object(OpenAIAssistantPDFParser, "_cleanup_resources")
+    def test_load_documents_text_only_skips_vector_store(
+        self,
+        mock_cleanup,
+        mock_analyze,
+        mock_upload,
+        mock_vector_store,
+        mock_getsize,
+        mock_parser,
+    ):
+        mock_upload.return_value = "file_id"
+        mock_analyze.return_value = {"text_content": "Test content", "tables": []}
+
+        result = list(mock_parser.load_documents(["test.pdf"], ["text"]))
+
+        assert result == [{"text_content": "Test content", "tables": []}]
+        mock_vector_store.assert_not_called()
+        mock_upload.assert_called_once_with("test.pdf")
+        mock_analyze.assert_called_once_with("file_id")
+        mock_cleanup.assert_called_once_with(["file_id"], None)
@@ -1,17 +1,25 @@
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import fitz
+import numpy as np
 import pandas as pd
 import pytest
 from PIL import Image
 
 from parsestudio.parsers.pymupdf_parser import (
+    TEXT_FLAGS,
     ImageElement,
     Metadata,
     ParserOutput,
     PyMuPDFParser,
     TableElement,
     TextElement,
+    _default_num_workers,
+    _init_worker,
+    _read_ahead,
 )
 
 
@@ -30,7 +38,10 @@ def mock_page():
             to_pandas=lambda: pd.DataFrame({"Header": ["Value"]}),
         )
     ]
-    mock.parent.extract_image.return_value = {"image": b"fake_image_data"}
+    mock.parent.extract_image.return_value = {
+        "image": b"fake_image_data",
+        "ext": "png",
+    }
     return mock
 
 
@@ -52,16 +63,16 @@ class TestPyMuPDFParser:
         mock_doc.load_page.side_effect = [MagicMock(), MagicMock()]
         mock_open.return_value.__enter__.return_value = mock_doc
 
-        pages = list(parser.load_documents(["test.pdf"]))
-        assert len(pages) == 1  # One document
-        assert len(pages[0]) == 2  # Two pages
+        documents = [list(pages) for pages in parser.load_documents(["test.pdf"])]
+        assert len(documents) == 1  # One document
+        assert len(documents[0]) == 2  # Two pages
 
     def test_parse_and_export_single_path(self, parser):
         """
         Test that the parser parses and exports a single document correctly.
         """
-        with patch.object(PyMuPDFParser, "load_documents") as mock_load:
-            mock_load.return_value = [[MagicMock()]]
+        with patch("fitz.open") as mock_open:
+            mock_open.return_value.__enter__.return_value.page_count = 1
             with patch.object(
                 PyMuPDFParser, "_PyMuPDFParser__export_result"
             ) as mock_export:
@@ -75,8 +86,8 @@ class TestPyMuPDFParser:
         """
         Test that the parser parses and exports multiple documents correctly
         """
-        with patch.object(PyMuPDFParser, "load_documents") as mock_load:
-            mock_load.return_value = [[MagicMock()], [MagicMock()]]
+        with patch("fitz.open") as mock_open:
+            mock_open.return_value.__enter__.return_value.page_count = 1
             with patch.object(
                 PyMuPDFParser, "_PyMuPDFParser__export_result"
             ) as mock_export:
@@ -85,6 +96,46 @@ class TestPyMuPDFParser:
                 assert isinstance(result, list)
                 assert len(result) == 2
                 assert all(isinstance(r, ParserOutput) for r in result)
+                assert mock_open.return_value.__exit__.call_count == 2
+
+    def test_iter_parse_yields_lazily(self, parser):
+        """
+        Test that documents are only opened as the outputs are consumed.
+        """
+        with patch("fitz.open") as mock_open:
+            mock_open.return_value.__enter__.return_value.page_count = 1
+            with patch.object(
+                PyMuPDFParser, "_PyMuPDFParser__export_result"
+            ) as mock_export:
+                mock_export.return_value = ParserOutput(text=TextElement(text="test"))
+                outputs = parser.iter_parse(["test1.pdf", "test2.pdf"])
+                mock_open.assert_not_called()
+                assert isinstance(next(outputs), ParserOutput)
+                assert mock_open.call_count == 1
+                assert len(list(outputs)) == 1
+
+    def test_iter_parse_invalid_modality(self, parser):
+        """
+        Test that invalid modalities are rejected before iterating.
+        """
+        with pytest.raises(ValueError, match="Invalid modality"):
+            parser.iter_parse("test.pdf", modalities=["audio"])
+
+    def test_parse_closes_document_on_error(self, parser):
+        """
+        Test that the document is closed when exporting it fails.
+        """
+        with patch("fitz.open") as mock_open:
+            with (
+                patch.object(
+                    PyMuPDFParser,
+                    "_PyMuPDFParser__export_result",
+                    side_effect=RuntimeError("export failed"),
+                ),
+                pytest.raises(RuntimeError, match="export failed"),
+            ):
+                parser.parse("test.pdf")
+            mock_open.return_value.__exit__.assert_called_once()
 
     def test_export_result(self, parser, mock_page):
         """
@@ -123,17 +174,113 @@ class TestPyMuPDFParser:
         """
         result = PyMuPDFParser._extract_text(mock_page)
         assert result.text == "Sample text"
-        mock_page.get_text.assert_called_once_with("text")
+        mock_page.get_text.assert_called_once_with("text", flags=TEXT_FLAGS)
 
     @patch("PIL.Image.open")
     def test_extract_images(self, mock_image_open, mock_page):
         """
         Test that the parser extracts images correctly.
         """
-        mock_image_open.return_value.convert.return_value = Image.new("RGB", (60, 30))
-        result = PyMuPDFParser._extract_images(mock_page)
+        rgb_image = Image.new("RGB", (60, 30))
+        with patch.object(
+            PyMuPDFParser, "_pixmap_to_rgb", return_value=rgb_image
+        ) as mock_pixmap:
+            result = PyMuPDFParser._extract_images(mock_page)
         assert len(result) == 1
-        assert isinstance(result[0].image, Image.Image)
+        assert result[0].image is rgb_image
+        mock_pixmap.assert_called_once_with(mock_page.parent, 1)
+        mock_image_open.return_value.convert.assert_not_called()
+
+    @patch("PIL.Image.open")
+    def test_extract_images_closes_converted_source(self, mock_image_open, mock_page):
+        """
+        Test that the source image of a converted image is closed.
+        """
+        source = mock_image_open.return_value
+        source.mode = "CMYK"
+        source.__enter__.return_value = source
+        rgb_image = Image.new("RGB", (60, 30))
+        with patch.object(PyMuPDFParser, "_pixmap_to_rgb", return_value=rgb_image):
+            result = PyMuPDFParser._extract_images(mock_page)
+        assert result[0].image is rgb_image
+        source.__exit__.assert_called_once()
+
+    @patch("PIL.Image.open")
+    def test_extract_images_skips_rgb_conversion(self, mock_image_open, mock_page):
+        """
+        Test that images already in RGB mode are not converted again.
+        """
+        rgb_image = Image.new("RGB", (60, 30))
+        mock_image_open.return_value = rgb_image
+        result = PyMuPDFParser._extract_images(mock_page)
+        assert result[0].image is rgb_image
+        assert result[0].image_bytes == b"fake_image_data"
+        assert result[0].image_format == "png"
+
+    def test_extract_images_reuses_cached_xref(self, mock_page):
+        """
+        Test that an image already extracted from the document is not extracted again.
+        """
+        rgb_image = Image.new("RGB", (60, 30))
+        image_cache = {1: (rgb_image, {"image": b"cached", "ext": "jpeg"})}
+        result = PyMuPDFParser._extract_images(mock_page, image_cache)
+        mock_page.parent.extract_image.assert_not_called()
+        assert result[0].image is rgb_image
+        assert result[0].image_bytes == b"cached"
+        assert result[0].metadata.page_number == 2
+
+    def test_parse_extracts_repeated_image_once(self, parser, tmp_path):
+        """
+        Test that an image shown on several pages is extracted once per document.
+        """
+        path = str(tmp_path / "logo.pdf")
+        logo = BytesIO()
+        Image.new("RGB", (8, 8), (255, 0, 0)).save(logo, format="PNG")
+        with fitz.open() as doc:
+            xref = 0
+            for _ in range(3):
+                page = doc.new_page()
+                xref = page.insert_image(
+                    fitz.Rect(0, 0, 50, 50), stream=logo.getvalue(), xref=xref
+                )
+            doc.save(path)
+
+        with patch.object(
+            fitz.Document,
+            "extract_image",
+            autospec=True,
+            side_effect=fitz.Document.extract_image,
+        ) as mock_extract:
+            result = parser.parse(path, ["images"])
+
+        assert mock_extract.call_count == 1
+        images = result[0].images
+        assert [image.metadata.page_number for image in images] == [1, 2, 3]
+        assert images[0].image is images[2].image
+
+    def test_parse_decodes_shared_image_once_per_batch(self, parser, tmp_path):
+        """
+        Test that an image shared by several documents is decoded once per batch.
+        """
+        logo = BytesIO()
+        Image.new("RGB", (8, 8), (0, 0, 255)).save(logo, format="PNG")
+        paths = []
+        for name in ("a", "b"):
+            path = str(tmp_path / f"{name}.pdf")
+            with fitz.open() as doc:
+                doc.new_page().insert_image(
+                    fitz.Rect(0, 0, 50, 50), stream=logo.getvalue()
+                )
+                doc.save(path)
+            paths.append(path)
+
+        with patch(
+            "parsestudio.parsers.pymupdf_parser.Image.open", wraps=Image.open
+        ) as mock_open:
+            result = parser.parse(paths, ["images"])
+
+        assert mock_open.call_count == 1
+        assert result[0].images[0].image is result[1].images[0].image
 
     def test_extract_tables(self, mock_page):
         """
@@ -142,3 +289,288 @@ class TestPyMuPDFParser:
         result = PyMuPDFParser._extract_tables(mock_page)
         assert len(result) == 1
         assert isinstance(result[0].dataframe, pd.DataFrame)
+
+    def test_parse_parallel_matches_sequential(self, parser, tmp_path):
+        """
+        Test that parsing with worker processes gives the same output as sequential parsing.
+        """
+        path = str(tmp_path / "test.pdf")
+        with fitz.open() as doc:
+            for i in range(6):
+                doc.new_page().insert_text((72, 72), f"Page {i}")
+            doc.save(path)
+
+        sequential = parser.parse(path, ["text"])
+        parallel = parser.parse(path, ["text"], num_workers=2)
+        assert parallel[0].text.text == sequential[0].text.text
+        assert "Page 5" in parallel[0].text.text
+
+    def test_parse_parallel_multiple_documents(self, parser, tmp_path, monkeypatch):
+        """
+        Test that the pages of several documents are parsed in one pool and regrouped per document.
+        """
+        paths = []
+        for name, page_count in (("a", 5), ("b", 0), ("c", 2)):
+            path = str(tmp_path / f"{name}.pdf")
+            with fitz.open() as doc:
+                for i in range(max(page_count, 1)):
+                    page = doc.new_page()
+                    if i < page_count:
+                        page.insert_text((72, 72), f"{name} page {i}")
+                doc.save(path)
+            paths.append(path)
+
+        monkeypatch.setattr("parsestudio.parsers.pymupdf_parser.DEFAULT_NUM_WORKERS", 2)
+        monkeypatch.delenv("PARSESTUDIO_WORKERS", raising=False)
+        with patch(
+            "parsestudio.parsers.pymupdf_parser.ProcessPoolExecutor",
+            side_effect=lambda max_workers, **kwargs: ThreadPoolExecutor(max_workers),
+        ) as mock_executor:
+            parallel = parser.parse(paths, ["text"], num_workers=None)
+
+        mock_executor.assert_called_once()
+        assert (
+            mock_executor.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+        )
+        sequential = parser.parse(paths, ["text"])
+        assert [output.text.text for output in parallel] == [
+            output.text.text for output in sequential
+        ]
+        assert "a page 4" in parallel[0].text.text
+        assert "c page 1" in parallel[2].text.text
+
+    def test_extract_page_skips_unrequested_modalities(self, mock_page):
+        """
+        Test that only the requested modalities of a page are extracted.
+        """
+        with patch.object(PyMuPDFParser, "_extract_images") as mock_extract_images:
+            text, tables, images = PyMuPDFParser._extract_page(mock_page, ["tables"])
+
+        mock_extract_images.assert_not_called()
+        mock_page.get_text.assert_not_called()
+        assert text == ""
+        assert len(tables) == 1
+        assert images == []
+
+    def test_parse_releases_pages_one_at_a_time(self, parser, tmp_path, monkeypatch):
+        """
+        Test that at most one page of a document is alive while it is parsed.
+        """
+        path = str(tmp_path / "pages.pdf")
+        with fitz.open() as doc:
+            for i in range(5):
+                doc.new_page().insert_text((72, 72), f"Page {i}")
+            doc.save(path)
+
+        alive_pages = []
+        max_alive = 0
+        extract_page = PyMuPDFParser._extract_page
+
+        def tracking_extract_page(page, *args):
+            nonlocal max_alive
+            alive_pages.append(weakref.ref(page))
+            max_alive = max(max_alive, sum(ref() is not None for ref in alive_pages))
+            return extract_page(page, *args)
+
+        # A plain function rather than a Mock, which would keep the pages in its call list
+        monkeypatch.setattr(
+            PyMuPDFParser, "_extract_page", staticmethod(tracking_extract_page)
+        )
+        result = parser.parse(path, ["text"])
+
+        assert "Page 4" in result[0].text.text
+        assert len(alive_pages) == 5
+        assert max_alive <= 2
+
+    def test_parse_parallel_batches_tasks(self, parser, tmp_path):
+        """
+        Test that many page tasks are sent to the workers in batches.
+        """
+        path = str(tmp_path / "long.pdf")
+        with fitz.open() as doc:
+            for i in range(64):
+                doc.new_page().insert_text((72, 72), f"Page {i}")
+            doc.save(path)
+
+        executor = ThreadPoolExecutor(2)
+        with (
+            patch(
+                "parsestudio.parsers.pymupdf_parser.ProcessPoolExecutor",
+                return_value=executor,
+            ),
+            patch.object(executor, "map", wraps=executor.map) as mock_map,
+        ):
+            result = parser.parse(path, ["text"], num_workers=2)
+
+        # 64 pages make 16 tasks, sent in batches of 2 to each of the 2 workers
+        assert mock_map.call_args.kwargs["chunksize"] == 2
+        assert "Page 63" in result[0].text.text
+
+    def test_parse_prefetch_matches_sequential(self, parser, tmp_path):
+        """
+        Test that reading files ahead gives the same outputs, in order.
+        """
+        paths = []
+        for i in range(4):
+            path = str(tmp_path / f"doc{i}.pdf")
+            with fitz.open() as doc:
+                doc.new_page().insert_text((72, 72), f"Document {i}")
+                doc.save(path)
+            paths.append(path)
+
+        prefetched = parser.parse(paths, ["text"], prefetch=True)
+        sequential = parser.parse(paths, ["text"])
+        assert [output.text.text for output in prefetched] == [
+            output.text.text for output in sequential
+        ]
+        assert "Document 3" in prefetched[3].text.text
+
+    def test_init_worker_silences_mupdf(self):
+        """
+        Test that worker processes do not print MuPDF messages to stderr.
+        """
+        with (
+            patch.object(fitz.TOOLS, "mupdf_display_errors") as mock_errors,
+            patch.object(fitz.TOOLS, "mupdf_display_warnings") as mock_warnings,
+        ):
+            _init_worker()
+        mock_errors.assert_called_once_with(False)
+        mock_warnings.assert_called_once_with(False)
+
+    def test_read_ahead_keeps_order(self, tmp_path):
+        """
+        Test that read-ahead yields the files in order and reports read errors.
+        """
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"file{i}"
+            path.write_bytes(str(i).encode())
+            paths.append(str(path))
+
+        contents = _read_ahead(paths, 2)
+        assert next(contents) == b"0"
+        assert list(contents) == [b"1", b"2", b"3", b"4"]
+
+        with pytest.raises(FileNotFoundError):
+            list(_read_ahead([str(tmp_path / "missing")], 2))
+
+    def test_default_num_workers_from_env(self, monkeypatch):
+        """
+        Test that PARSESTUDIO_WORKERS overrides the default worker count.
+        """
+        monkeypatch.setattr("parsestudio.parsers.pymupdf_parser.DEFAULT_NUM_WORKERS", 2)
+        monkeypatch.setenv("PARSESTUDIO_WORKERS", "6")
+        assert _default_num_workers() == 6
+
+        monkeypatch.setenv("PARSESTUDIO_WORKERS", "many")
+        assert _default_num_workers() == 2
+
+        monkeypatch.delenv("PARSESTUDIO_WORKERS")
+        assert _default_num_workers() == 2
+
+    def test_parse_parallel_single_task_inline(self, parser, tmp_path):
+        """
+        Test that a document fitting in one task is parsed without starting a pool.
+        """
+        path = str(tmp_path / "short.pdf")
+        with fitz.open() as doc:
+            doc.new_page().insert_text((72, 72), "Short")
+            doc.save(path)
+
+        with patch(
+            "parsestudio.parsers.pymupdf_parser.ProcessPoolExecutor"
+        ) as mock_executor:
+            result = parser.parse(path, ["text"], num_workers=4)
+
+        mock_executor.assert_not_called()
+        assert "Short" in result[0].text.text
+
+    def test_extract_tables_markdown_only(self, mock_page):
+        """
+        Test that the DataFrame is not built when only markdown is requested.
+        """
+        result = PyMuPDFParser._extract_tables(mock_page, ["markdown"])
+        assert len(result) == 1
+        assert result[0].markdown == "| Header |\n|--------|"
+        assert result[0].dataframe is None
+
+    def test_extract_tables_fast_mode_skips_pages_without_drawings(self, mock_page):
+        """
+        Test that fast mode skips table detection on pages without vector graphics.
+        """
+        mock_page.get_cdrawings.return_value = []
+        assert PyMuPDFParser._extract_tables(mock_page, fast_mode=True) == []
+        mock_page.find_tables.assert_not_called()
+
+        mock_page.get_cdrawings.return_value = [{"items": []}]
+        assert len(PyMuPDFParser._extract_tables(mock_page, fast_mode=True)) == 1
+
+    def test_parse_fast_mode_keeps_ruled_tables(self, parser, tmp_path):
+        """
+        Test that fast mode still finds tables drawn with ruling lines.
+        """
+        path = str(tmp_path / "tables.pdf")
+        with fitz.open() as doc:
+            doc.new_page().insert_text((72, 72), "No table here")
+            page = doc.new_page()
+            for row in range(3):
+                for col in range(2):
+                    x, y = 72 + col * 100, 72 + row * 30
+                    page.draw_rect(fitz.Rect(x, y, x + 100, y + 30))
+                    page.insert_text((x + 5, y + 20), f"r{row}c{col}")
+            doc.save(path)
+
+        fast = parser.parse(path, ["tables"], fast_mode=True)
+        assert len(fast[0].tables) == len(parser.parse(path, ["tables"])[0].tables)
+        assert fast[0].tables[0].metadata.page_number == 2
+
+    def test_parse_invalid_table_format(self, parser):
+        """
+        Test that an invalid table format raises an error.
+        """
+        with pytest.raises(ValueError, match="Invalid table format"):
+            parser.parse("test.pdf", table_formats=["csv"])
+
+    def test_convert_to_rgb_uses_simplejpeg_for_jpeg(self):
+        """
+        Test that JPEG images are decoded with simplejpeg when it is available.
+        """
+        gray = Image.new("L", (60, 30))
+        with patch("parsestudio.parsers.pymupdf_parser.simplejpeg") as mock_jpeg:
+            mock_jpeg.decode_jpeg.return_value = np.zeros((30, 60, 3), dtype=np.uint8)
+            result = PyMuPDFParser._convert_to_rgb(
+                gray, {"image": b"jpeg_data", "ext": "jpeg"}, MagicMock(), 1
+            )
+        mock_jpeg.decode_jpeg.assert_called_once_with(b"jpeg_data", colorspace="RGB")
+        assert result.mode == "RGB"
+        assert result.size == (60, 30)
+
+    def test_convert_to_rgb_uses_pixmap(self):
+        """
+        Test that non-JPEG images are rendered to RGB by PyMuPDF.
+        """
+        gray = Image.new("L", (60, 30), color=128)
+        buffer = BytesIO()
+        gray.save(buffer, "PNG")
+        with fitz.open() as doc:
+            page = doc.new_page()
+            xref = page.insert_image(fitz.Rect(0, 0, 60, 30), stream=buffer.getvalue())
+            result = PyMuPDFParser._convert_to_rgb(
+                gray, {"image": buffer.getvalue(), "ext": "png"}, doc, xref
+            )
+        assert result.mode == "RGB"
+        assert result.size == (60, 30)
+        assert result.getpixel((0, 0)) == (128, 128, 128)
+
+    def test_convert_to_rgb_falls_back_to_pillow(self):
+        """
+        Test that images PyMuPDF cannot render are converted with Pillow.
+        """
+        gray = Image.new("L", (60, 30))
+        with patch.object(
+            PyMuPDFParser, "_pixmap_to_rgb", side_effect=RuntimeError("bad image")
+        ):
+            result = PyMuPDFParser._convert_to_rgb(
+                gray, {"image": b"", "ext": "png"}, MagicMock(), 1
+            )
+        assert result.mode == "RGB"
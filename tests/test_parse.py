@@ -0,0 +1,167 @@
+import inspect
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from parsestudio.parse import PDFParser
+from parsestudio.parsers.schemas import ParserOutput, TextElement
+
+
+class FakeParser:
+    def __init__(self):
+        self.parse = MagicMock(side_effect=self._parse)
+
+    @staticmethod
+    def _parse(paths, modalities=None, **kwargs):
+        if isinstance(paths, str):
+            paths = [paths]
+        return [
+            ParserOutput(text=TextElement(text=path), tables=[], images=[])
+            for path in paths
+        ]
+
+
+@pytest.fixture
+def parser():
+    PDFParser.register_parser("fake", FakeParser)
+    PDFParser.clear_cache()
+    yield PDFParser(parser="fake")
+    PDFParser.clear_cache()
+    PDFParser.PARSER_MAP.pop("fake")
+
+
+@pytest.fixture
+def pdf_paths(tmp_path):
+    paths = []
+    for name in ("a.pdf", "b.pdf"):
+        path = tmp_path / name
+        path.write_bytes(b"%PDF-1.4")
+        paths.append(str(path))
+    return paths
+
+
+class TestPDFParser:
+    def test_invalid_parser(self):
+        with pytest.raises(ValueError, match="Invalid parser"):
+            PDFParser(parser="unknown")
+
+    def test_run_uses_cache(self, parser, pdf_paths):
+        first = parser.run(pdf_paths[0], ["text"], cache=True)
+        second = parser.run(pdf_paths[0], ["text"], cache=True)
+        assert second[0] is first[0]
+        parser.parser.parse.assert_called_once()
+
+    def test_run_parses_only_uncached_paths(self, parser, pdf_paths):
+        parser.run(pdf_paths[0], ["text"], cache=True)
+        result = parser.run(pdf_paths, ["text"], cache=True)
+        assert [output.text.text for output in result] == pdf_paths
+        parser.parser.parse.assert_called_with([pdf_paths[1]], modalities=["text"])
+
+    def test_run_invalidates_modified_file(self, parser, pdf_paths):
+        parser.run(pdf_paths[0], ["text"], cache=True)
+        with open(pdf_paths[0], "ab") as file:
+            file.write(b"\n%%EOF")
+        parser.run(pdf_paths[0], ["text"], cache=True)
+        assert parser.parser.parse.call_count == 2
+
+    def test_run_without_cache(self, parser, pdf_paths):
+        parser.run(pdf_paths[0], ["text"], cache=False)
+        parser.run(pdf_paths[0], ["text"], cache=False)
+        assert parser.parser.parse.call_count == 2
+
+    def test_run_does_not_cache_by_default(self, parser, pdf_paths):
+        parser.run(pdf_paths[0], ["text"])
+        parser.run(pdf_paths[0], ["text"])
+        assert parser.parser.parse.call_count == 2
+        assert PDFParser._PARSE_CACHE == {}
+
+    def test_run_does_not_cache_empty_output(self, parser, pdf_paths):
+        parser.parser.parse.side_effect = lambda paths, **kwargs: [
+            ParserOutput(text=TextElement(text=""), tables=[], images=[]) for _ in paths
+        ]
+        parser.run(pdf_paths[0], ["text"], cache=True)
+        parser.run(pdf_paths[0], ["text"], cache=True)
+        assert parser.parser.parse.call_count == 2
+        assert PDFParser._PARSE_CACHE == {}
+
+    def test_run_output_count_mismatch(self, parser, pdf_paths):
+        parser.parser.parse.side_effect = lambda paths, **kwargs: []
+        with pytest.raises(ValueError, match="Parser returned 0 outputs for 2 files"):
+            parser.run(pdf_paths, ["text"], cache=True)
+
+    def test_iter_run_streams_without_cache(self, parser, pdf_paths):
+        outputs = parser.iter_run(pdf_paths, ["text"])
+        assert next(outputs).text.text == pdf_paths[0]
+        parser.parser.parse.assert_called_once_with([pdf_paths[0]], modalities=["text"])
+        assert [output.text.text for output in outputs] == pdf_paths[1:]
+        assert PDFParser._PARSE_CACHE == {}
+
+    def test_iter_run_uses_iter_parse(self, parser, pdf_paths):
+        parser.parser.iter_parse = MagicMock(return_value=iter(["output"]))
+        assert list(parser.iter_run(pdf_paths, ["text"])) == ["output"]
+        parser.parser.iter_parse.assert_called_once_with(pdf_paths, modalities=["text"])
+        parser.parser.parse.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "name", ["docling", "llama", "pymupdf", "anthropic", "openai"]
+    )
+    def test_iter_parse_accepts_parse_arguments(self, name):
+        parser_class = PDFParser._load_parser_class(name)
+        iter_parse = getattr(parser_class, "iter_parse", None)
+        if iter_parse is None:
+            pytest.skip(f"{name} streams through parse")
+        parse_kwargs = {
+            param.name: param.default
+            for param in list(
+                inspect.signature(parser_class.parse).parameters.values()
+            )[3:]
+            if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+        }
+        inspect.signature(iter_parse).bind(
+            None, ["a.pdf"], modalities=["text"], **parse_kwargs
+        )
+
+    def test_iter_run_with_run_arguments(self, pdf_paths):
+        parser = PDFParser(parser="pymupdf")
+        kwargs = {"num_workers": 1, "table_formats": ["markdown"], "fast_mode": True}
+        with patch.object(
+            parser.parser, "_iter_parse", return_value=iter(["output"])
+        ) as mock_iter_parse:
+            assert list(parser.iter_run(pdf_paths, ["text"], **kwargs)) == ["output"]
+        mock_iter_parse.assert_called_once_with(
+            pdf_paths, frozenset(["text"]), ["markdown"], False, True
+        )
+
+    def test_cache_evicts_oldest_entry(self, parser, pdf_paths, monkeypatch):
+        monkeypatch.setattr(PDFParser, "PARSE_CACHE_SIZE", 1)
+        parser.run(pdf_paths[0], ["text"], cache=True)
+        parser.run(pdf_paths[1], ["text"], cache=True)
+        parser.run(pdf_paths[0], ["text"], cache=True)
+        assert parser.parser.parse.call_count == 3
+
+    def test_invalid_cache_key(self):
+        with pytest.raises(ValueError, match="Invalid cache key"):
+            PDFParser(parser="pymupdf", cache_key="path")
+
+    def test_run_cache_by_content(self, parser, pdf_paths, tmp_path):
+        parser._cache_by_content = True
+        copy_path = tmp_path / "copy.pdf"
+        copy_path.write_bytes(b"%PDF-1.4")
+
+        first = parser.run(pdf_paths[0], ["text"], cache=True)
+        second = parser.run(str(copy_path), ["text"], cache=True)
+        assert second[0] is first[0]
+        parser.parser.parse.assert_called_once()
+
+        copy_path.write_bytes(b"%PDF-1.7")
+        parser.run(str(copy_path), ["text"], cache=True)
+        assert parser.parser.parse.call_count == 2
+
+    def test_file_digest_reused_while_unchanged(self, parser, pdf_paths):
+        parser._cache_by_content = True
+        parser.run(pdf_paths[0], ["text"], cache=True)
+        PDFParser._PARSE_CACHE.clear()
+        with patch("parsestudio.parse.open") as mock_open:
+            parser.run(pdf_paths[0], ["text"], cache=True)
+        mock_open.assert_not_called()
+        assert parser.parser.parse.call_count == 2